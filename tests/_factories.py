@@ -0,0 +1,42 @@
+"""Shared tree factories for tests."""
+
+from tree.services.tree import TreeService
+
+
+def make_sample_tree() -> TreeService:
+    """Create the canonical sample tree.
+
+    Structure:
+        root
+        ├── a
+        │   ├── a1
+        │   └── a2
+        └── b
+            └── b1
+    """
+    tree = TreeService()
+    tree.create_node("root", "Root")
+    tree.bulk_create("root", [("a", "A", {}), ("b", "B", {})])
+    tree.bulk_create("a", [("a1", "A1", {}), ("a2", "A2", {})])
+    tree.bulk_create("b", [("b1", "B1", {})])
+    return tree
+
+
+def make_chain(depth: int, start: int = 0) -> TreeService:
+    """Create a linear tree of `depth` nodes with IDs start, start + 1, ...
+
+    Each node is described as "Level {i}" and is the only child of the one before it.
+    """
+    tree = TreeService()
+    tree.create_node(str(start), f"Level {start}")
+    for i in range(start + 1, start + depth):
+        tree.create_node(str(i), f"Level {i}", parent_id=str(i - 1))
+    return tree
+
+
+def make_siblings(n: int) -> TreeService:
+    """Create a root with `n` children: child-0 .. child-{n-1}."""
+    tree = TreeService()
+    tree.create_node("root", "Root")
+    tree.bulk_create("root", [(f"child-{i}", f"Child {i}", {}) for i in range(n)])
+    return tree
@@ -0,0 +1,35 @@
+"""Shared fixtures for tests."""
+
+import pickle
+
+import pytest
+
+from tests._factories import make_sample_tree
+from tree.services.tree import TreeService
+
+
+@pytest.fixture(scope="session")
+def sample_tree_snapshot() -> bytes:
+    """Build the sample tree once and snapshot it for cheap per-test restores.
+
+    The whole service is pickled, not just its nodes, so child lists, positions and the
+    root id come back with it.
+    """
+    return pickle.dumps(make_sample_tree())
+
+
+@pytest.fixture(scope="session")
+def sample_tree_service(sample_tree_snapshot: bytes) -> TreeService:
+    """Create the sample tree once for the session (see tests._factories.make_sample_tree).
+
+    Read-only: tests that mutate the tree must use fresh_tree_service instead.
+    """
+    tree: TreeService = pickle.loads(sample_tree_snapshot)
+    return tree
+
+
+@pytest.fixture
+def fresh_tree_service(sample_tree_snapshot: bytes) -> TreeService:
+    """Restore a private sample tree for tests that mutate it or need cold caches."""
+    tree: TreeService = pickle.loads(sample_tree_snapshot)
+    return tree
@@ -1,46 +1,197 @@
 """Integration tests for the Tree API."""
 
-import pytest
-from fastapi.testclient import TestClient
+import asyncio
+from collections.abc import AsyncIterator, Iterator
+from typing import Any
 
+import orjson
+import pytest
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient, Response
+from pydantic import BaseModel
+from starlette.types import Message, Scope
+
+from tree.dependencies import (
+    get_context_builder,
+    get_link_builder,
+    get_traversal_service,
+    get_tree_service,
+    get_zipper_service,
+)
 from tree.main import app
+from tree.models import Node
+from tree.models.responses import CollapseRequest, ExpandRequest, NodeCreate, NodeUpdate
+from tree.services.traversal import TraversalService
+from tree.services.tree import TreeService
+from tree.services.zipper import ZipperService
+from tree.utils.context import ContextBuilder
+from tree.utils.link_builder import LinkBuilder
+
+# Share one event loop across the module so the session-scoped client can be reused,
+# and opt every test here (and only here) into a fresh service graph
+pytestmark = [
+    pytest.mark.asyncio(loop_scope="session"),
+    pytest.mark.usefixtures("reset_services"),
+]
+
+
+JSON_HEADERS = {"content-type": "application/json"}
+
+
+def encode(body: BaseModel) -> bytes:
+    """Serialize a request model the way the router will parse it, omitting unset fields."""
+    return body.model_dump_json(exclude_unset=True).encode()
+
+
+# Request bodies are built from the router's own models and encoded once at import
+CHILD_1_BODY = encode(NodeCreate(id="child-1", description="Child 1"))
+CHILD_1_WITH_METADATA_BODY = encode(
+    NodeCreate(id="child-1", description="Child 1", metadata={"key": "value"})
+)
+DUPLICATE_CHILD_1_BODY = encode(NodeCreate(id="child-1", description="Duplicate"))
+UPDATED_DESCRIPTION_BODY = encode(NodeUpdate(description="Updated"))
+NEW_METADATA_BODY = encode(NodeUpdate(metadata={"new": "data"}))
+EXPAND_TWO_CHILDREN_BODY = encode(
+    ExpandRequest(
+        children=[
+            {"id": "new-1", "description": "New 1"},
+            {"id": "new-2", "description": "New 2", "metadata": {"key": "value"}},
+        ]
+    )
+)
+EXPAND_ONE_CHILD_BODY = encode(ExpandRequest(children=[{"id": "new", "description": "New"}]))
+EXPAND_EMPTY_DESCRIPTION_BODY = b'{"children": [{"id": "new", "description": ""}]}'
+COLLAPSE_SUMMARY_BODY = encode(CollapseRequest(summary="Collapsed branch"))
+EMPTY_BODY = encode(CollapseRequest())
+
+
+def json_of(response: Response) -> Any:
+    """Decode a response body with orjson instead of the stdlib json module."""
+    return orjson.loads(response.content)
+
+
+async def post_json(client: AsyncClient, url: str, body: bytes) -> Response:
+    """POST a pre-encoded JSON body."""
+    return await client.post(url, content=body, headers=JSON_HEADERS)
+
+
+async def patch_json(client: AsyncClient, url: str, body: bytes) -> Response:
+    """PATCH a pre-encoded JSON body."""
+    return await client.patch(url, content=body, headers=JSON_HEADERS)
+
+
+async def asgi_status(method: str, path: str, body: bytes = b"") -> int:
+    """Call the ASGI app directly and return only the response status code.
+
+    Skips httpx's request/response object model for tests that assert on status alone.
+    """
+    scope: Scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"content-type", b"application/json")] if body else [],
+        "server": ("test", 80),
+    }
+    status = 0
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message: Message) -> None:
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app(scope, receive, send)
+    return status
 
 
-@pytest.fixture(autouse=True)
-def reset_services():
-    """Reset singleton services before each test."""
-    import tree.dependencies as deps
+@pytest.fixture
+def reset_services() -> Iterator[TreeService]:
+    """Bind a fresh service graph to the app for each test."""
+    tree = TreeService()
+    zipper = ZipperService(tree)
+    traversal = TraversalService(tree)
+    context_builder = ContextBuilder(tree)
+    link_builder = LinkBuilder(tree, zipper, traversal)
+
+    app.dependency_overrides[get_tree_service] = lambda: tree
+    app.dependency_overrides[get_zipper_service] = lambda: zipper
+    app.dependency_overrides[get_traversal_service] = lambda: traversal
+    app.dependency_overrides[get_context_builder] = lambda: context_builder
+    app.dependency_overrides[get_link_builder] = lambda: link_builder
+    yield tree
+    app.dependency_overrides.clear()
 
-    deps._tree_service = None
-    deps._zipper_service = None
-    deps._traversal_service = None
-    deps._context_builder = None
-    deps._link_builder = None
-    yield
+
+@pytest.fixture
+def tree(reset_services: TreeService) -> TreeService:
+    """The TreeService bound to the app for the current test."""
+    return reset_services
 
 
 @pytest.fixture
-def client():
-    """Create a test client."""
-    return TestClient(app)
+def root_node(tree: TreeService) -> TreeService:
+    """Seed the tree with just the root node."""
+    tree.create_node("root", "Root")
+    return tree
+
+
+@pytest.fixture
+def root_with_child(root_node: TreeService) -> TreeService:
+    """Seed root -> child-1."""
+    root_node.create_node("child-1", "Child 1", parent_id="root")
+    return root_node
+
+
+@pytest.fixture
+def root_with_two_children(root_with_child: TreeService) -> TreeService:
+    """Seed root -> [child-1, child-2]."""
+    root_with_child.create_node("child-2", "Child 2", parent_id="root")
+    return root_with_child
+
+
+@pytest.fixture
+def root_with_grandchild(root_with_child: TreeService) -> TreeService:
+    """Seed root -> child-1 -> grandchild-1."""
+    root_with_child.create_node("grandchild-1", "GC 1", parent_id="child-1")
+    return root_with_child
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def client() -> AsyncIterator[AsyncClient]:
+    """Create one async test client for the session; state is reset per test.
+
+    ASGITransport does not emit lifespan events, so the app's lifespan is entered
+    here once and any startup work is paid before the first test runs.
+    """
+    async with app.router.lifespan_context(app):
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+            yield ac
 
 
 class TestRootEndpoint:
     """Test root endpoints."""
 
-    def test_get_api_root(self, client: TestClient) -> None:
+    async def test_get_api_root(self, client: AsyncClient) -> None:
         """Test getting API root."""
-        response = client.get("/")
+        response = await client.get("/")
         assert response.status_code == 200
-        data = response.json()
+        data = json_of(response)
         assert "message" in data
         assert "links" in data
 
-    def test_get_or_create_root_node(self, client: TestClient) -> None:
+    async def test_get_or_create_root_node(self, client: AsyncClient) -> None:
         """Test getting/creating root node."""
-        response = client.get("/nodes/root")
+        response = await client.get("/nodes/root")
         assert response.status_code == 200
-        data = response.json()
+        data = json_of(response)
 
         assert data["id"] == "root"
         assert data["is_leaf"] is True
@@ -48,30 +199,43 @@ class TestRootEndpoint:
         assert "links" in data
         assert data["context"]["depth"] == 0
 
+    async def test_concurrent_root_requests_create_root_once(
+        self, client: AsyncClient, tree: TreeService
+    ) -> None:
+        """Test that simultaneous first requests agree on a single root."""
+        responses = await asyncio.gather(*(client.get("/nodes/root") for _ in range(8)))
+        assert [r.status_code for r in responses] == [200] * 8
+        assert tree.node_count() == 1
+
 
 class TestNodeCRUD:
     """Test node CRUD operations."""
 
-    def test_get_nonexistent_node_returns_404(self, client: TestClient) -> None:
-        """Test getting a non-existent node."""
-        response = client.get("/nodes/nonexistent")
-        assert response.status_code == 404
-
-    def test_create_and_get_child_node(self, client: TestClient) -> None:
+    @pytest.mark.parametrize(
+        ("method", "path", "body"),
+        [
+            ("GET", "/nodes/nonexistent", b""),
+            ("GET", "/nodes/nonexistent/children", b""),
+            ("POST", "/nodes/nonexistent/children", CHILD_1_BODY),
+            ("PATCH", "/nodes/nonexistent", UPDATED_DESCRIPTION_BODY),
+            ("DELETE", "/nodes/nonexistent", b""),
+        ],
+    )
+    async def test_nonexistent_node_returns_404(self, method: str, path: str, body: bytes) -> None:
+        """Test that every node endpoint returns 404 for a non-existent node."""
+        assert await asgi_status(method, path, body) == 404
+
+    @pytest.mark.usefixtures("root_node")
+    async def test_create_and_get_child_node(self, client: AsyncClient) -> None:
         """Test creating and retrieving a child node."""
-        # First create root
-        client.get("/nodes/root")
-
-        # Create child
-        create_response = client.post(
-            "/nodes/root/children",
-            json={"id": "child-1", "description": "Child 1", "metadata": {"key": "value"}},
+        create_response = await post_json(
+            client, "/nodes/root/children", CHILD_1_WITH_METADATA_BODY
         )
         assert create_response.status_code == 201
         assert "Location" in create_response.headers
         assert create_response.headers["Location"] == "/nodes/child-1"
 
-        created_data = create_response.json()
+        created_data = json_of(create_response)
         assert created_data["id"] == "child-1"
         assert created_data["parent_id"] == "root"
         assert created_data["description"] == "Child 1"
@@ -79,146 +243,107 @@ class TestNodeCRUD:
         assert created_data["is_leaf"] is True
 
         # Verify we can get it
-        get_response = client.get("/nodes/child-1")
+        get_response = await client.get("/nodes/child-1")
         assert get_response.status_code == 200
-        assert get_response.json()["id"] == "child-1"
-
-    def test_create_child_with_invalid_parent_returns_404(self, client: TestClient) -> None:
-        """Test creating a child with non-existent parent."""
-        response = client.post(
-            "/nodes/nonexistent/children",
-            json={"id": "child-1", "description": "Child 1"},
-        )
-        assert response.status_code == 404
+        assert json_of(get_response)["id"] == "child-1"
 
-    def test_create_duplicate_node_returns_409(self, client: TestClient) -> None:
+    @pytest.mark.usefixtures("root_with_child")
+    async def test_create_duplicate_node_returns_409(self) -> None:
         """Test creating a duplicate node."""
-        client.get("/nodes/root")
-        client.post(
-            "/nodes/root/children",
-            json={"id": "child-1", "description": "Child 1"},
-        )
-
-        # Try to create duplicate
-        response = client.post(
-            "/nodes/root/children",
-            json={"id": "child-1", "description": "Duplicate"},
-        )
-        assert response.status_code == 409
+        status = await asgi_status("POST", "/nodes/root/children", DUPLICATE_CHILD_1_BODY)
+        assert status == 409
 
-    def test_update_node_description(self, client: TestClient) -> None:
+    @pytest.mark.usefixtures("root_with_child")
+    async def test_update_node_description(self, client: AsyncClient) -> None:
         """Test updating a node's description."""
-        client.get("/nodes/root")
-        client.post(
-            "/nodes/root/children",
-            json={"id": "child-1", "description": "Original"},
-        )
-
-        # Update description
-        response = client.patch(
-            "/nodes/child-1",
-            json={"description": "Updated"},
-        )
+        response = await patch_json(client, "/nodes/child-1", UPDATED_DESCRIPTION_BODY)
         assert response.status_code == 200
-        data = response.json()
+        data = json_of(response)
         assert data["description"] == "Updated"
 
         # Verify persistence
-        get_response = client.get("/nodes/child-1")
-        assert get_response.json()["description"] == "Updated"
+        get_response = await client.get("/nodes/child-1")
+        assert json_of(get_response)["description"] == "Updated"
 
-    def test_update_node_metadata(self, client: TestClient) -> None:
+    async def test_update_node_metadata(self, client: AsyncClient, root_node: TreeService) -> None:
         """Test updating a node's metadata."""
-        client.get("/nodes/root")
-        client.post(
-            "/nodes/root/children",
-            json={"id": "child-1", "description": "Test", "metadata": {"old": "value"}},
-        )
+        root_node.create_node("child-1", "Test", parent_id="root", metadata={"old": "value"})
 
-        # Update metadata
-        response = client.patch(
-            "/nodes/child-1",
-            json={"metadata": {"new": "data"}},
-        )
+        response = await patch_json(client, "/nodes/child-1", NEW_METADATA_BODY)
         assert response.status_code == 200
-        data = response.json()
+        data = json_of(response)
         assert data["metadata"] == {"new": "data"}
 
-    def test_update_nonexistent_node_returns_404(self, client: TestClient) -> None:
-        """Test updating a non-existent node."""
-        response = client.patch(
-            "/nodes/nonexistent",
-            json={"description": "Updated"},
-        )
-        assert response.status_code == 404
-
-    def test_delete_node(self, client: TestClient) -> None:
+    @pytest.mark.usefixtures("root_with_child")
+    async def test_delete_node(self, client: AsyncClient) -> None:
         """Test deleting a node."""
-        client.get("/nodes/root")
-        client.post(
-            "/nodes/root/children",
-            json={"id": "child-1", "description": "To delete"},
-        )
-
-        # Delete the node
-        response = client.delete("/nodes/child-1")
+        response = await client.delete("/nodes/child-1")
         assert response.status_code == 204
 
         # Verify it's gone
-        get_response = client.get("/nodes/child-1")
+        get_response = await client.get("/nodes/child-1")
         assert get_response.status_code == 404
 
-    def test_delete_nonexistent_node_returns_404(self, client: TestClient) -> None:
-        """Test deleting a non-existent node."""
-        response = client.delete("/nodes/nonexistent")
-        assert response.status_code == 404
-
-    def test_delete_root_node_returns_409(self, client: TestClient) -> None:
+    @pytest.mark.usefixtures("root_node")
+    async def test_delete_root_node_returns_409(self) -> None:
         """Test that deleting root node fails."""
-        client.get("/nodes/root")
-
-        response = client.delete("/nodes/root")
-        assert response.status_code == 409
+        assert await asgi_status("DELETE", "/nodes/root") == 409
 
 
 class TestChildren:
     """Test children endpoints."""
 
-    def test_get_children_of_leaf_returns_empty(self, client: TestClient) -> None:
+    @pytest.mark.usefixtures("root_node")
+    async def test_get_children_of_leaf_returns_empty(self, client: AsyncClient) -> None:
         """Test getting children of a leaf node."""
-        client.get("/nodes/root")
-
-        response = client.get("/nodes/root/children")
+        response = await client.get("/nodes/root/children")
         assert response.status_code == 200
-        assert response.json() == []
+        assert json_of(response) == []
 
-    def test_get_children_of_branch(self, client: TestClient) -> None:
+    @pytest.mark.usefixtures("root_with_two_children")
+    async def test_get_children_of_branch(self, client: AsyncClient) -> None:
         """Test getting children of a branch node."""
-        client.get("/nodes/root")
-        client.post("/nodes/root/children", json={"id": "child-1", "description": "Child 1"})
-        client.post("/nodes/root/children", json={"id": "child-2", "description": "Child 2"})
-
-        response = client.get("/nodes/root/children")
+        response = await client.get("/nodes/root/children")
         assert response.status_code == 200
-        children = response.json()
+        children = json_of(response)
         assert len(children) == 2
-        assert {c["id"] for c in children} == {"child-1", "child-2"}
+        assert [c["id"] for c in children] == ["child-1", "child-2"]
+
+    async def test_get_children_during_concurrent_create(
+        self,
+        client: AsyncClient,
+        root_with_two_children: TreeService,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that a child added while the listing is built does not break the response."""
+        tree = root_with_two_children
+        get_children_with_counts = tree.get_children_with_counts
+
+        def read_then_create(node_id: str) -> list[tuple[Node, int]]:
+            # Simulate another request adding a child right after the listing was read
+            result = get_children_with_counts(node_id)
+            monkeypatch.undo()
+            tree.create_node("child-3", "Child 3", parent_id=node_id)
+            return result
+
+        monkeypatch.setattr(tree, "get_children_with_counts", read_then_create)
+        response = await client.get("/nodes/root/children")
 
-    def test_get_children_of_nonexistent_node_returns_404(self, client: TestClient) -> None:
-        """Test getting children of non-existent node."""
-        response = client.get("/nodes/nonexistent/children")
-        assert response.status_code == 404
+        assert response.status_code == 200
+        assert [c["id"] for c in json_of(response)] == ["child-1", "child-2"]
+        # The patch ran, so the concurrent child really landed mid-request
+        assert tree.get_node("child-3").parent_id == "root"
 
 
 class TestHATEOAS:
     """Test HATEOAS links in responses."""
 
-    def test_node_response_includes_links(self, client: TestClient) -> None:
+    @pytest.mark.usefixtures("root_node")
+    async def test_node_response_includes_links(self, client: AsyncClient) -> None:
         """Test that node responses include HATEOAS links."""
-        client.get("/nodes/root")
-        response = client.get("/nodes/root")
+        response = await client.get("/nodes/root")
 
-        data = response.json()
+        data = json_of(response)
         assert "links" in data
         links = data["links"]
 
@@ -227,39 +352,34 @@ class TestHATEOAS:
         assert "root" in links
         assert links["self"]["href"] == "root"
 
-    def test_links_reflect_tree_structure(self, client: TestClient) -> None:
+    @pytest.mark.usefixtures("root_with_child")
+    async def test_links_reflect_tree_structure(self, client: AsyncClient) -> None:
         """Test that links accurately reflect tree structure."""
-        client.get("/nodes/root")
-        client.post("/nodes/root/children", json={"id": "child-1", "description": "Child 1"})
-
-        # Root should now have down link
-        root_response = client.get("/nodes/root")
-        root_links = root_response.json()["links"]
+        # Root should have down link
+        root_response = await client.get("/nodes/root")
+        root_links = json_of(root_response)["links"]
         assert "down" in root_links
         assert root_links["down"]["href"] == "child-1"
 
         # Child should have up link
-        child_response = client.get("/nodes/child-1")
-        child_links = child_response.json()["links"]
+        child_response = await client.get("/nodes/child-1")
+        child_links = json_of(child_response)["links"]
         assert "up" in child_links
         assert child_links["up"]["href"] == "root"
 
-    def test_sibling_links(self, client: TestClient) -> None:
+    @pytest.mark.usefixtures("root_with_two_children")
+    async def test_sibling_links(self, client: AsyncClient) -> None:
         """Test left/right sibling links."""
-        client.get("/nodes/root")
-        client.post("/nodes/root/children", json={"id": "child-1", "description": "Child 1"})
-        client.post("/nodes/root/children", json={"id": "child-2", "description": "Child 2"})
-
         # First child should have right link
-        child1_response = client.get("/nodes/child-1")
-        child1_links = child1_response.json()["links"]
+        child1_response = await client.get("/nodes/child-1")
+        child1_links = json_of(child1_response)["links"]
         assert "right" in child1_links
         assert child1_links["right"]["href"] == "child-2"
         assert "left" not in child1_links
 
         # Second child should have left link
-        child2_response = client.get("/nodes/child-2")
-        child2_links = child2_response.json()["links"]
+        child2_response = await client.get("/nodes/child-2")
+        child2_links = json_of(child2_response)["links"]
         assert "left" in child2_links
         assert child2_links["left"]["href"] == "child-1"
         assert "right" not in child2_links
@@ -268,31 +388,26 @@ class TestHATEOAS:
 class TestContext:
     """Test context information in responses."""
 
-    def test_context_includes_depth(self, client: TestClient) -> None:
+    @pytest.mark.usefixtures("root_with_grandchild")
+    async def test_context_includes_depth(self, client: AsyncClient) -> None:
         """Test that context includes correct depth."""
-        client.get("/nodes/root")
-        client.post("/nodes/root/children", json={"id": "child-1", "description": "Child 1"})
-        client.post("/nodes/child-1/children", json={"id": "grandchild-1", "description": "GC 1"})
-
         # Root depth = 0
-        root_response = client.get("/nodes/root")
-        assert root_response.json()["context"]["depth"] == 0
+        root_response = await client.get("/nodes/root")
+        assert json_of(root_response)["context"]["depth"] == 0
 
         # Child depth = 1
-        child_response = client.get("/nodes/child-1")
-        assert child_response.json()["context"]["depth"] == 1
+        child_response = await client.get("/nodes/child-1")
+        assert json_of(child_response)["context"]["depth"] == 1
 
         # Grandchild depth = 2
-        gc_response = client.get("/nodes/grandchild-1")
-        assert gc_response.json()["context"]["depth"] == 2
+        gc_response = await client.get("/nodes/grandchild-1")
+        assert json_of(gc_response)["context"]["depth"] == 2
 
-    def test_context_includes_breadcrumbs(self, client: TestClient) -> None:
+    @pytest.mark.usefixtures("root_with_child")
+    async def test_context_includes_breadcrumbs(self, client: AsyncClient) -> None:
         """Test that context includes breadcrumbs."""
-        client.get("/nodes/root")
-        client.post("/nodes/root/children", json={"id": "child-1", "description": "Child 1"})
-
-        response = client.get("/nodes/child-1")
-        context = response.json()["context"]
+        response = await client.get("/nodes/child-1")
+        context = json_of(response)["context"]
 
         assert len(context["breadcrumbs"]) == 1
         assert context["breadcrumbs"][0]["id"] == "root"
@@ -301,70 +416,47 @@ class TestContext:
 class TestZoomOperations:
     """Test expand/collapse operations."""
 
-    def test_expand_leaf_node(self, client: TestClient) -> None:
+    @pytest.mark.usefixtures("root_with_child")
+    async def test_expand_leaf_node(self, client: AsyncClient) -> None:
         """Test expanding a leaf node."""
-        client.get("/nodes/root")
-        client.post("/nodes/root/children", json={"id": "leaf", "description": "Leaf"})
-
-        # Expand the leaf
-        response = client.post(
-            "/nodes/leaf/expand",
-            json={
-                "children": [
-                    {"id": "new-1", "description": "New 1"},
-                    {"id": "new-2", "description": "New 2"},
-                ]
-            },
-        )
+        response = await post_json(client, "/nodes/child-1/expand", EXPAND_TWO_CHILDREN_BODY)
         assert response.status_code == 200
-        data = response.json()
+        data = json_of(response)
         assert data["is_leaf"] is False
 
         # Verify children were created
-        children_response = client.get("/nodes/leaf/children")
-        children = children_response.json()
+        children_response = await client.get("/nodes/child-1/children")
+        children = json_of(children_response)
         assert len(children) == 2
+        assert [child["metadata"] for child in children] == [{}, {"key": "value"}]
+
+    @pytest.mark.usefixtures("root_with_child")
+    async def test_expand_rejects_invalid_child(self, tree: TreeService) -> None:
+        """Test that expand children are held to the same limits as created nodes."""
+        status = await asgi_status("POST", "/nodes/child-1/expand", EXPAND_EMPTY_DESCRIPTION_BODY)
+        assert status == 422
+        assert tree.get_node("child-1").is_leaf is True
 
-    def test_expand_branch_returns_409(self, client: TestClient) -> None:
+    @pytest.mark.usefixtures("root_with_grandchild")
+    async def test_expand_branch_returns_409(self) -> None:
         """Test that expanding a branch node fails."""
-        client.get("/nodes/root")
-        client.post("/nodes/root/children", json={"id": "branch", "description": "Branch"})
-        client.post("/nodes/branch/children", json={"id": "child", "description": "Child"})
-
-        # Try to expand already-expanded node
-        response = client.post(
-            "/nodes/branch/expand",
-            json={"children": [{"id": "new", "description": "New"}]},
-        )
-        assert response.status_code == 409
+        status = await asgi_status("POST", "/nodes/child-1/expand", EXPAND_ONE_CHILD_BODY)
+        assert status == 409
 
-    def test_collapse_branch_node(self, client: TestClient) -> None:
+    @pytest.mark.usefixtures("root_with_grandchild")
+    async def test_collapse_branch_node(self, client: AsyncClient) -> None:
         """Test collapsing a branch node."""
-        client.get("/nodes/root")
-        client.post("/nodes/root/children", json={"id": "branch", "description": "Branch"})
-        client.post("/nodes/branch/children", json={"id": "child", "description": "Child"})
-
-        # Collapse the branch
-        response = client.post(
-            "/nodes/branch/collapse",
-            json={"summary": "Collapsed branch"},
-        )
+        response = await post_json(client, "/nodes/child-1/collapse", COLLAPSE_SUMMARY_BODY)
         assert response.status_code == 200
-        data = response.json()
+        data = json_of(response)
         assert data["is_leaf"] is True
         assert data["description"] == "Collapsed branch"
 
         # Verify children were deleted
-        child_response = client.get("/nodes/child")
+        child_response = await client.get("/nodes/grandchild-1")
         assert child_response.status_code == 404
 
-    def test_collapse_leaf_returns_409(self, client: TestClient) -> None:
+    @pytest.mark.usefixtures("root_with_child")
+    async def test_collapse_leaf_returns_409(self) -> None:
         """Test that collapsing a leaf node fails."""
-        client.get("/nodes/root")
-        client.post("/nodes/root/children", json={"id": "leaf", "description": "Leaf"})
-
-        response = client.post(
-            "/nodes/leaf/collapse",
-            json={},
-        )
-        assert response.status_code == 409
+        assert await asgi_status("POST", "/nodes/child-1/collapse", EMPTY_BODY) == 409
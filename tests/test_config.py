@@ -0,0 +1,30 @@
+"""Tests for application settings."""
+
+from collections.abc import Iterator
+
+import pytest
+
+from tree.config import get_settings
+
+
+@pytest.fixture
+def fresh_settings() -> Iterator[None]:
+    """Make get_settings re-read the environment, and forget the result afterwards."""
+    get_settings.cache_clear()
+    yield
+    get_settings.cache_clear()
+
+
+class TestSettings:
+    """Test the settings factory."""
+
+    def test_settings_are_cached(self) -> None:
+        """Test that repeated calls share one Settings instance."""
+        assert get_settings() is get_settings()
+
+    @pytest.mark.usefixtures("fresh_settings")
+    def test_settings_read_prefixed_environment(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that TREE_API_-prefixed variables override the defaults."""
+        monkeypatch.setenv("TREE_API_PORT", "9000")
+
+        assert get_settings().port == 9000
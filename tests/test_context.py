@@ -1,10 +1,21 @@
 """Tests for Context and Breadcrumb models."""
 
+from typing import Any
+
 import pytest
 from pydantic import ValidationError
 
 from tree.models import Breadcrumb, Context
 
+# Minimal valid Context fields (a root leaf); tests override one field at a time
+VALID_CONTEXT_KWARGS: dict[str, Any] = {
+    "depth": 0,
+    "sibling_position": 0,
+    "total_siblings": 1,
+    "has_children": False,
+    "children_count": 0,
+}
+
 
 class TestBreadcrumb:
     """Test Breadcrumb model creation and validation."""
@@ -43,6 +54,21 @@ class TestBreadcrumb:
         with pytest.raises(ValidationError):
             Breadcrumb(id="x" * 256, description="Test")  # Too long
 
+    def test_breadcrumb_is_frozen(self) -> None:
+        """Test that breadcrumbs cannot be modified after creation."""
+        breadcrumb = Breadcrumb(id="node-1", description="Test")
+
+        with pytest.raises(ValidationError):
+            breadcrumb.description = "Changed"
+
+    def test_intern_reuses_identical_breadcrumbs(self) -> None:
+        """Test that interning returns one shared object per (id, description)."""
+        breadcrumb = Breadcrumb.intern("node-1", "Test")
+
+        assert Breadcrumb.intern("node-1", "Test") is breadcrumb
+        assert Breadcrumb.intern("node-1", "Renamed") is not breadcrumb
+        assert breadcrumb == Breadcrumb(id="node-1", description="Test")
+
 
 class TestContext:
     """Test Context model creation and validation."""
@@ -80,10 +106,10 @@ class TestContext:
         )
 
         assert context.depth == 0
-        assert context.breadcrumbs == []
+        assert context.breadcrumbs == ()
 
-    def test_breadcrumbs_defaults_to_empty_list(self) -> None:
-        """Test that breadcrumbs defaults to empty list."""
+    def test_breadcrumbs_defaults_to_empty_tuple(self) -> None:
+        """Test that breadcrumbs defaults to an empty tuple."""
         context = Context(
             depth=0,
             sibling_position=0,
@@ -92,22 +118,34 @@ class TestContext:
             children_count=0,
         )
 
-        assert context.breadcrumbs == []
-        assert isinstance(context.breadcrumbs, list)
+        assert context.breadcrumbs == ()
+        assert isinstance(context.breadcrumbs, tuple)
+
+    def test_context_is_frozen(self) -> None:
+        """Test that a context cannot be modified after creation."""
+        context = Context(**VALID_CONTEXT_KWARGS)
+
+        with pytest.raises(ValidationError):
+            context.depth = 99
+
+    @pytest.mark.parametrize(
+        ("field_name", "bad_value"),
+        [
+            ("depth", -1),
+            ("sibling_position", -1),
+            ("total_siblings", 0),
+            ("children_count", -1),
+        ],
+    )
+    def test_field_lower_bounds(self, field_name: str, bad_value: int) -> None:
+        """Test that each count/position field rejects values below its lower bound."""
+        kwargs = {**VALID_CONTEXT_KWARGS, field_name: bad_value}
 
-    def test_depth_must_be_non_negative(self) -> None:
-        """Test that depth must be >= 0."""
         with pytest.raises(ValidationError) as exc_info:
-            Context(
-                depth=-1,
-                sibling_position=0,
-                total_siblings=1,
-                has_children=False,
-                children_count=0,
-            )
+            Context(**kwargs)
 
         errors = exc_info.value.errors()
-        assert any(e["loc"] == ("depth",) for e in errors)
+        assert any(e["loc"] == (field_name,) for e in errors)
 
     def test_depth_zero_is_valid(self) -> None:
         """Test that depth of 0 is valid (root)."""
@@ -121,34 +159,6 @@ class TestContext:
 
         assert context.depth == 0
 
-    def test_sibling_position_must_be_non_negative(self) -> None:
-        """Test that sibling_position must be >= 0."""
-        with pytest.raises(ValidationError) as exc_info:
-            Context(
-                depth=0,
-                sibling_position=-1,
-                total_siblings=1,
-                has_children=False,
-                children_count=0,
-            )
-
-        errors = exc_info.value.errors()
-        assert any(e["loc"] == ("sibling_position",) for e in errors)
-
-    def test_total_siblings_must_be_at_least_one(self) -> None:
-        """Test that total_siblings must be >= 1."""
-        with pytest.raises(ValidationError) as exc_info:
-            Context(
-                depth=0,
-                sibling_position=0,
-                total_siblings=0,  # Invalid
-                has_children=False,
-                children_count=0,
-            )
-
-        errors = exc_info.value.errors()
-        assert any(e["loc"] == ("total_siblings",) for e in errors)
-
     def test_total_siblings_one_is_valid(self) -> None:
         """Test that total_siblings of 1 is valid (only child)."""
         context = Context(
@@ -161,20 +171,6 @@ class TestContext:
 
         assert context.total_siblings == 1
 
-    def test_children_count_must_be_non_negative(self) -> None:
-        """Test that children_count must be >= 0."""
-        with pytest.raises(ValidationError) as exc_info:
-            Context(
-                depth=0,
-                sibling_position=0,
-                total_siblings=1,
-                has_children=False,
-                children_count=-1,
-            )
-
-        errors = exc_info.value.errors()
-        assert any(e["loc"] == ("children_count",) for e in errors)
-
     def test_children_count_zero_is_valid(self) -> None:
         """Test that children_count of 0 is valid (leaf)."""
         context = Context(
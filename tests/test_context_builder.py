@@ -1,56 +1,72 @@
 """Tests for ContextBuilder."""
 
 import pytest
+from pydantic import ValidationError
 
-from tree.services.tree import TreeService
+from tests._factories import make_chain, make_siblings
+from tree.models import Context, Node
+from tree.services.tree import TreeNotFoundError, TreeService
 from tree.utils.context import ContextBuilder
 
 
 @pytest.fixture
-def sample_tree() -> tuple[TreeService, ContextBuilder]:
-    """Create a sample tree for testing.
-
-    Structure:
-        root
-        ├── a
-        │   ├── a1
-        │   └── a2
-        └── b
-            └── b1
+def sample_tree(fresh_tree_service: TreeService) -> tuple[TreeService, ContextBuilder]:
+    """Wrap a private sample tree, since many tests here mutate it or need a cold cache."""
+    return fresh_tree_service, ContextBuilder(fresh_tree_service)
+
+
+@pytest.fixture(scope="module")
+def contexts(sample_tree_service: TreeService) -> dict[str, Context]:
+    """Build the context of every sample-tree node once for read-only assertions.
+
+    Sharing them across tests relies on Context being frozen, so no test can alter them.
     """
+    builder = ContextBuilder(sample_tree_service)
+    return {node_id: builder.build_context(node_id) for node_id in ("root", "a", "b", "a1", "b1")}
+
+
+@pytest.fixture(scope="module")
+def deep_chain() -> tuple[TreeService, ContextBuilder]:
+    """Create a 10-level chain: 0 -> 1 -> ... -> 9."""
+    tree = make_chain(10)
+    return tree, ContextBuilder(tree)
+
+
+@pytest.fixture(scope="module")
+def tree_5_siblings() -> tuple[TreeService, ContextBuilder]:
+    """Create a root with five children: child-0 .. child-4."""
+    tree = make_siblings(5)
+    return tree, ContextBuilder(tree)
+
+
+@pytest.fixture(scope="module")
+def tree_7_children() -> tuple[TreeService, ContextBuilder]:
+    """Create root -> parent with seven children: child-0 .. child-6."""
     tree = TreeService()
     tree.create_node("root", "Root")
-    tree.create_node("a", "A", parent_id="root")
-    tree.create_node("b", "B", parent_id="root")
-    tree.create_node("a1", "A1", parent_id="a")
-    tree.create_node("a2", "A2", parent_id="a")
-    tree.create_node("b1", "B1", parent_id="b")
+    tree.create_node("parent", "Parent", parent_id="root")
+    tree.bulk_create("parent", [(f"child-{i}", f"Child {i}", {}) for i in range(7)])
 
-    builder = ContextBuilder(tree)
-    return tree, builder
+    return tree, ContextBuilder(tree)
 
 
 class TestContextBuilderBasics:
     """Test basic context building."""
 
-    def test_build_context_for_root(self, sample_tree: tuple[TreeService, ContextBuilder]) -> None:
+    def test_build_context_for_root(self, contexts: dict[str, Context]) -> None:
         """Test building context for root node."""
-        _, builder = sample_tree
-
-        context = builder.build_context("root")
+        context = contexts["root"]
 
         assert context.depth == 0  # No ancestors
         assert context.sibling_position == 0
         assert context.total_siblings == 1  # Root is its own sibling
         assert context.has_children is True
         assert context.children_count == 2
-        assert context.breadcrumbs == []
+        assert context.breadcrumbs == ()
 
-    def test_build_context_for_child(self, sample_tree: tuple[TreeService, ContextBuilder]) -> None:
+    def test_build_context_for_child(self, contexts: dict[str, Context]) -> None:
         """Test building context for first-level child."""
-        _, builder = sample_tree
-
-        context = builder.build_context("a")
+        context = contexts["a"]
 
         assert context.depth == 1  # One ancestor (root)
         assert context.sibling_position == 0  # First sibling
@@ -61,13 +77,9 @@ class TestContextBuilderBasics:
         assert context.breadcrumbs[0].id == "root"
         assert context.breadcrumbs[0].description == "Root"
 
-    def test_build_context_for_grandchild(
-        self, sample_tree: tuple[TreeService, ContextBuilder]
-    ) -> None:
+    def test_build_context_for_grandchild(self, contexts: dict[str, Context]) -> None:
         """Test building context for second-level child."""
-        _, builder = sample_tree
-
-        context = builder.build_context("a1")
+        context = contexts["a1"]
 
         assert context.depth == 2  # Two ancestors (root, a)
         assert context.sibling_position == 0  # First sibling
@@ -78,11 +90,9 @@ class TestContextBuilderBasics:
         assert context.breadcrumbs[0].id == "root"
         assert context.breadcrumbs[1].id == "a"
 
-    def test_build_context_for_leaf(self, sample_tree: tuple[TreeService, ContextBuilder]) -> None:
+    def test_build_context_for_leaf(self, contexts: dict[str, Context]) -> None:
         """Test building context for leaf node."""
-        _, builder = sample_tree
-
-        context = builder.build_context("b1")
+        context = contexts["b1"]
 
         assert context.depth == 2
         assert context.has_children is False
@@ -111,19 +121,16 @@ class TestContextBuilderSiblingPosition:
         context = builder.build_context("b")
         assert context.sibling_position == 1
 
-    def test_sibling_position_with_many_siblings(self) -> None:
+    @pytest.mark.parametrize("i", range(5))
+    def test_sibling_position_with_many_siblings(
+        self, tree_5_siblings: tuple[TreeService, ContextBuilder], i: int
+    ) -> None:
         """Test sibling position with many siblings."""
-        tree = TreeService()
-        tree.create_node("root", "Root")
-        for i in range(5):
-            tree.create_node(f"child-{i}", f"Child {i}", parent_id="root")
+        _, builder = tree_5_siblings
 
-        builder = ContextBuilder(tree)
-
-        for i in range(5):
-            context = builder.build_context(f"child-{i}")
-            assert context.sibling_position == i
-            assert context.total_siblings == 5
+        context = builder.build_context(f"child-{i}")
+        assert context.sibling_position == i
+        assert context.total_siblings == 5
 
 
 class TestContextBuilderBreadcrumbs:
@@ -136,7 +143,7 @@ class TestContextBuilderBreadcrumbs:
         _, builder = sample_tree
 
         context = builder.build_context("root")
-        assert context.breadcrumbs == []
+        assert context.breadcrumbs == ()
 
     def test_breadcrumbs_order(self, sample_tree: tuple[TreeService, ContextBuilder]) -> None:
         """Test that breadcrumbs are ordered from root to parent."""
@@ -150,13 +157,7 @@ class TestContextBuilderBreadcrumbs:
 
     def test_breadcrumbs_deep_tree(self) -> None:
         """Test breadcrumbs on a deep tree."""
-        tree = TreeService()
-        tree.create_node("1", "Level 1")
-        tree.create_node("2", "Level 2", parent_id="1")
-        tree.create_node("3", "Level 3", parent_id="2")
-        tree.create_node("4", "Level 4", parent_id="3")
-
-        builder = ContextBuilder(tree)
+        builder = ContextBuilder(make_chain(4, start=1))
         context = builder.build_context("4")
 
         assert context.depth == 3
@@ -174,6 +175,79 @@ class TestContextBuilderBreadcrumbs:
         assert context.breadcrumbs[0].description == "Root"
         assert context.breadcrumbs[1].description == "A"
 
+    def test_breadcrumbs_shared_between_siblings(
+        self, sample_tree: tuple[TreeService, ContextBuilder]
+    ) -> None:
+        """Test that siblings reuse the same breadcrumb objects for common ancestors."""
+        _, builder = sample_tree
+
+        first = builder.build_context("a1").breadcrumbs
+        second = builder.build_context("a2").breadcrumbs
+
+        assert all(x is y for x, y in zip(first, second, strict=True))
+
+    def test_breadcrumbs_follow_renames(
+        self, sample_tree: tuple[TreeService, ContextBuilder]
+    ) -> None:
+        """Test that a renamed ancestor shows up with its new description."""
+        tree, builder = sample_tree
+
+        tree.update_node("a", description="Renamed")
+
+        assert builder.build_context("a1").breadcrumbs[1].description == "Renamed"
+
+    def test_breadcrumb_walk_reused_by_siblings(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that a sibling's breadcrumbs come from the cached trail, not a new walk."""
+        tree = make_chain(20)
+        tree.bulk_create("19", [("left", "Left", {}), ("right", "Right", {})])
+        builder = ContextBuilder(tree)
+        builder.build_context("left")
+
+        lookups: list[str] = []
+        get_node = tree.get_node
+
+        def counting_get_node(node_id: str) -> Node:
+            lookups.append(node_id)
+            return get_node(node_id)
+
+        monkeypatch.setattr(tree, "get_node", counting_get_node)
+        context = builder.build_context("right")
+
+        assert [b.id for b in context.breadcrumbs] == [str(i) for i in range(20)]
+        assert "0" not in lookups
+
+    def test_breadcrumbs_follow_moves(
+        self, sample_tree: tuple[TreeService, ContextBuilder]
+    ) -> None:
+        """Test that cached trails are dropped when the tree changes."""
+        tree, builder = sample_tree
+        assert [b.id for b in builder.build_context("a1").breadcrumbs] == ["root", "a"]
+
+        tree.move_node("a", "b")
+
+        assert [b.id for b in builder.build_context("a1").breadcrumbs] == ["root", "b", "a"]
+
+    def test_rename_during_walk_is_not_cached(
+        self, sample_tree: tuple[TreeService, ContextBuilder], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a trail walked across a concurrent rename is not kept for the new version."""
+        tree, builder = sample_tree
+        get_node = tree.get_node
+
+        def get_node_then_rename(node_id: str) -> Node:
+            # Simulate another request renaming root once the walk has read it
+            node = get_node(node_id)
+            if node_id == "root":
+                monkeypatch.undo()
+                tree.update_node("root", description="New Root")
+                builder.build_context("root")
+            return node
+
+        monkeypatch.setattr(tree, "get_node", get_node_then_rename)
+        builder.build_context("a1")
+
+        assert builder.build_context("a2").breadcrumbs[0].description == "New Root"
+
 
 class TestContextBuilderChildrenInfo:
     """Test children information in context."""
@@ -194,16 +268,12 @@ class TestContextBuilderChildrenInfo:
         assert context.has_children is False
         assert context.children_count == 0
 
-    def test_children_count_accuracy(self) -> None:
+    def test_children_count_accuracy(
+        self, tree_7_children: tuple[TreeService, ContextBuilder]
+    ) -> None:
         """Test that children_count is accurate."""
-        tree = TreeService()
-        tree.create_node("root", "Root")
-        tree.create_node("parent", "Parent", parent_id="root")
+        _, builder = tree_7_children
 
-        for i in range(7):
-            tree.create_node(f"child-{i}", f"Child {i}", parent_id="parent")
-
-        builder = ContextBuilder(tree)
         context = builder.build_context("parent")
 
         assert context.children_count == 7
@@ -229,16 +299,132 @@ class TestContextBuilderDepth:
             context = builder.build_context(node_id)
             assert context.depth == len(context.breadcrumbs)
 
-    def test_depth_calculation_in_deep_tree(self) -> None:
+    @pytest.mark.parametrize("i", range(10))
+    def test_depth_calculation_in_deep_tree(
+        self, deep_chain: tuple[TreeService, ContextBuilder], i: int
+    ) -> None:
         """Test depth in a very deep tree."""
-        tree = TreeService()
-        tree.create_node("0", "Level 0")
+        _, builder = deep_chain
 
-        for i in range(1, 10):
-            tree.create_node(str(i), f"Level {i}", parent_id=str(i - 1))
+        context = builder.build_context(str(i))
+        assert context.depth == i
 
-        builder = ContextBuilder(tree)
 
-        for i in range(10):
-            context = builder.build_context(str(i))
-            assert context.depth == i
+class TestContextBuilderChildContexts:
+    """Test building contexts for all children of a node at once."""
+
+    @pytest.mark.parametrize("parent_id", ["root", "a", "b", "a1"])
+    def test_child_contexts_match_individual_contexts(
+        self, sample_tree: tuple[TreeService, ContextBuilder], parent_id: str
+    ) -> None:
+        """Test that each batched context equals the one built for that child alone."""
+        tree, builder = sample_tree
+
+        pairs = builder.build_child_contexts(parent_id)
+
+        assert [child for child, _ in pairs] == tree.get_children(parent_id)
+        # A separate builder, so the comparison is not against the contexts just cached
+        single = ContextBuilder(tree)
+        assert [context for _, context in pairs] == [
+            single.build_context(child.id) for child, _ in pairs
+        ]
+
+    def test_child_contexts_for_nonexistent_node_fails(
+        self, sample_tree: tuple[TreeService, ContextBuilder]
+    ) -> None:
+        """Test that an unknown parent raises."""
+        _, builder = sample_tree
+
+        with pytest.raises(TreeNotFoundError):
+            builder.build_child_contexts("nonexistent")
+
+
+class TestContextBuilderCaching:
+    """Test reuse of contexts between tree changes."""
+
+    def test_repeat_call_reuses_context(
+        self, sample_tree: tuple[TreeService, ContextBuilder]
+    ) -> None:
+        """Test that an unchanged tree returns the same Context object."""
+        _, builder = sample_tree
+
+        assert builder.build_context("a1") is builder.build_context("a1")
+
+    def test_child_contexts_are_reused_by_build_context(
+        self, sample_tree: tuple[TreeService, ContextBuilder]
+    ) -> None:
+        """Test that contexts built for a parent's children serve later single lookups."""
+        _, builder = sample_tree
+
+        (_, a1_context), (_, a2_context) = builder.build_child_contexts("a")
+
+        assert builder.build_context("a1") is a1_context
+        assert builder.build_context("a2") is a2_context
+
+    def test_cached_context_cannot_be_changed(
+        self, sample_tree: tuple[TreeService, ContextBuilder]
+    ) -> None:
+        """Test that a caller cannot corrupt the context later callers receive."""
+        _, builder = sample_tree
+        context = builder.build_context("a1")
+
+        with pytest.raises(ValidationError):
+            context.depth = 99
+        with pytest.raises(AttributeError):
+            context.breadcrumbs.append(context.breadcrumbs[0])  # type: ignore[attr-defined]
+
+        assert builder.build_context("a1").depth == 2
+
+    def test_mutation_invalidates_cached_context(
+        self, sample_tree: tuple[TreeService, ContextBuilder]
+    ) -> None:
+        """Test that contexts are recomputed after the tree changes."""
+        tree, builder = sample_tree
+        before = builder.build_context("a")
+
+        tree.create_node("a3", "A3", parent_id="a")
+        after = builder.build_context("a")
+
+        assert after is not before
+        assert after.children_count == 3
+
+    def test_write_during_build_is_not_cached(
+        self, sample_tree: tuple[TreeService, ContextBuilder], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a context built across a concurrent write is not kept for the new version."""
+        tree, builder = sample_tree
+        get_sibling_index = tree.get_sibling_index
+
+        def get_sibling_index_with_write(node_id: str) -> int:
+            # Simulate another request adding a child to a1, then a third reading the tree
+            monkeypatch.undo()
+            tree.create_node("a1-child", "A1 Child", parent_id="a1")
+            builder.build_context("root")
+            return get_sibling_index(node_id)
+
+        monkeypatch.setattr(tree, "get_sibling_index", get_sibling_index_with_write)
+        builder.build_context("a1")
+
+        context = builder.build_context("a1")
+        assert context.has_children is True
+        assert context.children_count == 1
+
+    def test_write_during_child_build_is_not_cached(
+        self, sample_tree: tuple[TreeService, ContextBuilder], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that child contexts built across a concurrent write are not kept."""
+        tree, builder = sample_tree
+        get_children_with_counts = tree.get_children_with_counts
+
+        def get_children_with_counts_then_write(node_id: str) -> list[tuple[Node, int]]:
+            # Simulate another request adding a child to a1 right after the children were read
+            children = get_children_with_counts(node_id)
+            monkeypatch.undo()
+            tree.create_node("a1-child", "A1 Child", parent_id="a1")
+            builder.build_context("root")
+            return children
+
+        monkeypatch.setattr(tree, "get_children_with_counts", get_children_with_counts_then_write)
+        builder.build_child_contexts("a")
+
+        assert builder.build_context("a1").children_count == 1
@@ -0,0 +1,36 @@
+"""Tests for dependency singletons."""
+
+from tree.dependencies import (
+    get_context_builder,
+    get_link_builder,
+    get_traversal_service,
+    get_tree_service,
+    get_zipper_service,
+)
+
+
+class TestDependencies:
+    """Test the FastAPI dependency getters."""
+
+    def test_getters_return_singletons(self) -> None:
+        """Test that each getter returns the same instance on every call."""
+        for getter in (
+            get_tree_service,
+            get_zipper_service,
+            get_traversal_service,
+            get_context_builder,
+            get_link_builder,
+        ):
+            assert getter() is getter()
+
+    def test_services_share_one_tree(self) -> None:
+        """Test that every service is wired to the TreeService singleton."""
+        tree = get_tree_service()
+
+        assert get_zipper_service().tree is tree
+        assert get_traversal_service().tree is tree
+        assert get_context_builder().tree is tree
+        link_builder = get_link_builder()
+        assert link_builder.tree is tree
+        assert link_builder.zipper is get_zipper_service()
+        assert link_builder.traversal is get_traversal_service()
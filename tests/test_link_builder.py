@@ -2,37 +2,29 @@
 
 import pytest
 
+from tests._factories import make_chain, make_siblings
+from tree.models import Link, Node
 from tree.services.traversal import TraversalService
-from tree.services.tree import TreeService
+from tree.services.tree import TreeNotFoundError, TreeService
 from tree.services.zipper import ZipperService
 from tree.utils.link_builder import LinkBuilder
 
 
+def _with_builder(tree: TreeService) -> tuple[TreeService, LinkBuilder]:
+    """Wire a LinkBuilder and its services around a tree."""
+    return tree, LinkBuilder(tree, ZipperService(tree), TraversalService(tree))
+
+
+@pytest.fixture(scope="module")
+def sample_tree(sample_tree_service: TreeService) -> tuple[TreeService, LinkBuilder]:
+    """Wrap the shared, read-only sample tree in a LinkBuilder."""
+    return _with_builder(sample_tree_service)
+
+
 @pytest.fixture
-def sample_tree() -> tuple[TreeService, LinkBuilder]:
-    """Create a sample tree for testing.
-
-    Structure:
-        root
-        ├── a
-        │   ├── a1
-        │   └── a2
-        └── b
-            └── b1
-    """
-    tree = TreeService()
-    tree.create_node("root", "Root")
-    tree.create_node("a", "A", parent_id="root")
-    tree.create_node("b", "B", parent_id="root")
-    tree.create_node("a1", "A1", parent_id="a")
-    tree.create_node("a2", "A2", parent_id="a")
-    tree.create_node("b1", "B1", parent_id="b")
-
-    zipper = ZipperService(tree)
-    traversal = TraversalService(tree)
-    builder = LinkBuilder(tree, zipper, traversal)
-
-    return tree, builder
+def fresh_sample_tree(fresh_tree_service: TreeService) -> tuple[TreeService, LinkBuilder]:
+    """Wrap a private sample tree for tests that mutate it or need a cold cache."""
+    return _with_builder(fresh_tree_service)
 
 
 class TestLinkBuilderBasicLinks:
@@ -256,6 +248,224 @@ class TestLinkBuilderChildrenLink:
         assert "Root" in links["children"].title
 
 
+class TestLinkBuilderCaching:
+    """Test per-version caching of computed links."""
+
+    def test_repeat_call_reuses_links(self, sample_tree: tuple[TreeService, LinkBuilder]) -> None:
+        """Test that an unchanged tree hands back the same links mapping."""
+        _, builder = sample_tree
+
+        assert builder.build_links("a") is builder.build_links("a")
+
+    def test_links_are_read_only(self, sample_tree: tuple[TreeService, LinkBuilder]) -> None:
+        """Test that callers cannot corrupt the cache through the returned mapping."""
+        _, builder = sample_tree
+        links = builder.build_links("a")
+
+        with pytest.raises(TypeError):
+            links["self"] = links["root"]  # type: ignore[index]
+
+    def test_mutation_invalidates_cached_links(
+        self, fresh_sample_tree: tuple[TreeService, LinkBuilder]
+    ) -> None:
+        """Test that links are recomputed after the tree changes."""
+        tree, builder = fresh_sample_tree
+        assert "right" not in builder.build_links("b")
+
+        tree.create_node("c", "C", parent_id="root")
+        tree.update_node("a", description="Renamed")
+
+        links = builder.build_links("b")
+        assert links["right"].href == "c"
+        assert links["left"].title == "Renamed"
+
+    def test_root_link_follows_root_rename(
+        self, fresh_sample_tree: tuple[TreeService, LinkBuilder]
+    ) -> None:
+        """Test that the shared root link is rebuilt when the root changes."""
+        tree, builder = fresh_sample_tree
+        assert builder.build_links("a1")["root"].title == "Root"
+
+        tree.update_node("root", description="New Root")
+
+        assert builder.build_links("b1")["root"].title == "New Root"
+
+    def test_root_rename_during_build_is_picked_up(
+        self, fresh_sample_tree: tuple[TreeService, LinkBuilder], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a root rename landing while the root link is built is not cached as current."""
+        tree, builder = fresh_sample_tree
+        get_root = tree.get_root
+
+        def get_root_then_rename() -> Node | None:
+            # Simulate another request renaming the root right after it was read
+            root = get_root()
+            monkeypatch.undo()
+            tree.update_node("root", description="New Root")
+            return root
+
+        monkeypatch.setattr(tree, "get_root", get_root_then_rename)
+        builder.build_links("a1")["root"]
+
+        assert builder.build_links("b1")["root"].title == "New Root"
+
+    def test_write_during_build_is_not_cached(
+        self, fresh_sample_tree: tuple[TreeService, LinkBuilder], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a view built across a concurrent write is not kept for the new version."""
+        tree, builder = fresh_sample_tree
+        get_node = tree.get_node
+
+        def get_node_then_write(node_id: str) -> Node:
+            # Simulate another request adding a child to a1, then a third reading links
+            node = get_node(node_id)
+            monkeypatch.undo()
+            tree.create_node("a1-child", "A1 Child", parent_id="a1")
+            builder.build_links("root")
+            return node
+
+        monkeypatch.setattr(tree, "get_node", get_node_then_write)
+        builder.build_links("a1")
+
+        links = builder.build_links("a1")
+        assert links["down"].href == "a1-child"
+        assert "children" in links
+
+
+class TestLinkBuilderLaziness:
+    """Test that links are only built when read."""
+
+    def test_links_are_built_once(
+        self, fresh_sample_tree: tuple[TreeService, LinkBuilder], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that reading the view again reuses the links already built."""
+        tree, builder = fresh_sample_tree
+        links = builder.build_links("a")
+        lookups: list[str] = []
+        get_node = tree.get_node
+
+        def counting_get_node(node_id: str) -> Node:
+            lookups.append(node_id)
+            return get_node(node_id)
+
+        monkeypatch.setattr(tree, "get_node", counting_get_node)
+        first = dict(links)
+        first_lookups = len(lookups)
+
+        assert first_lookups > 0
+        assert dict(links) == first
+        assert len(lookups) == first_lookups
+
+    def test_unknown_relations_build_nothing(
+        self, fresh_sample_tree: tuple[TreeService, LinkBuilder], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that lookups of unknown relations read nothing and do not join the view."""
+        tree, builder = fresh_sample_tree
+        links = builder.build_links("a")
+        rels = list(links)
+
+        def fail(node_id: str) -> None:
+            raise AssertionError(f"tree read for {node_id}")
+
+        monkeypatch.setattr(tree, "get_node", fail)
+        for i in range(100):
+            assert links.get(f"rel-{i}") is None
+            assert f"other-{i}" not in links
+
+        assert list(links) == rels
+
+    def test_reading_one_link_skips_the_others(
+        self, fresh_sample_tree: tuple[TreeService, LinkBuilder], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that reading one relation does not compute the traversal links."""
+        _, builder = fresh_sample_tree
+
+        def fail(node_id: str) -> None:
+            raise AssertionError(f"next-bfs computed for {node_id}")
+
+        monkeypatch.setattr(builder.traversal, "compute_next_bfs", fail)
+
+        assert builder.build_links("a")["up"].href == "root"
+
+    def test_node_shape_skips_inapplicable_navigation(
+        self, fresh_sample_tree: tuple[TreeService, LinkBuilder], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that leaves skip the child lookups and the root skips parent and siblings."""
+        _, builder = fresh_sample_tree
+
+        def fail(node_id: str) -> None:
+            raise AssertionError(f"navigation computed for {node_id}")
+
+        for name in ("up", "down", "left", "right"):
+            monkeypatch.setattr(builder.zipper, name, fail)
+
+        root_links = builder.build_links("root")
+        assert "up" not in root_links
+        assert root_links["self"] is root_links["root"]
+        assert "down" not in builder.build_links("a1")
+        assert "children" not in builder.build_links("a1")
+
+    def test_iteration_lists_present_links_in_order(
+        self, sample_tree: tuple[TreeService, LinkBuilder]
+    ) -> None:
+        """Test that iterating yields only applicable relations, in response order."""
+        _, builder = sample_tree
+
+        assert list(builder.build_links("a")) == [
+            "self",
+            "root",
+            "up",
+            "down",
+            "right",
+            "next-dfs",
+            "prev-dfs",
+            "next-bfs",
+            "children",
+        ]
+        assert len(builder.build_links("b1")) == 4
+
+    def test_build_links_for_nonexistent_node_fails(
+        self, sample_tree: tuple[TreeService, LinkBuilder]
+    ) -> None:
+        """Test that a missing node is rejected up front, not on first read."""
+        _, builder = sample_tree
+
+        with pytest.raises(TreeNotFoundError):
+            builder.build_links("nonexistent")
+
+
+class TestLinkBuilderBatch:
+    """Test building links for several nodes at once."""
+
+    def test_batch_matches_single_calls(self, sample_tree: tuple[TreeService, LinkBuilder]) -> None:
+        """Test that each batch entry equals the links built for that node alone."""
+        _, builder = sample_tree
+
+        batch = builder.build_links_batch(["a1", "a2", "b"])
+
+        assert list(batch) == ["a1", "a2", "b"]
+        for node_id, links in batch.items():
+            assert links == dict(builder.build_links(node_id))
+
+    def test_batch_restricted_to_rels(self, sample_tree: tuple[TreeService, LinkBuilder]) -> None:
+        """Test that only the requested relations that apply are returned."""
+        _, builder = sample_tree
+
+        batch = builder.build_links_batch(["a1", "a2"], rels={"left", "right"})
+
+        assert list(batch["a1"]) == ["right"]
+        assert list(batch["a2"]) == ["left"]
+
+    def test_batch_with_nonexistent_node_fails(
+        self, sample_tree: tuple[TreeService, LinkBuilder]
+    ) -> None:
+        """Test that an unknown ID anywhere in the batch raises."""
+        _, builder = sample_tree
+
+        with pytest.raises(TreeNotFoundError):
+            builder.build_links_batch(["a", "nonexistent"])
+
+
 class TestLinkBuilderEdgeCases:
     """Test edge cases and special scenarios."""
 
@@ -284,12 +494,28 @@ class TestLinkBuilderEdgeCases:
         assert "next-dfs" not in links
         assert "next-bfs" not in links
 
+    def test_single_node_tree_skips_navigation(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that a lone root never consults the zipper or traversal services."""
+        tree = TreeService()
+        tree.create_node("only", "Only node")
+        builder = LinkBuilder(tree, ZipperService(tree), TraversalService(tree))
+
+        def fail(node_id: str) -> None:
+            raise AssertionError(f"navigation computed for {node_id}")
+
+        for name in ("compute_next_dfs", "compute_prev_dfs", "compute_next_bfs"):
+            monkeypatch.setattr(builder.traversal, name, fail)
+        for name in ("up", "down", "left", "right"):
+            monkeypatch.setattr(builder.zipper, name, fail)
+
+        links = builder.build_links("only")
+
+        assert dict(links) == {"self": links["root"], "root": links["root"]}
+        assert links["self"] is links["root"]
+
     def test_links_for_linear_tree(self) -> None:
         """Test links for a linear tree (linked list)."""
-        tree = TreeService()
-        tree.create_node("1", "Node 1")
-        tree.create_node("2", "Node 2", parent_id="1")
-        tree.create_node("3", "Node 3", parent_id="2")
+        tree = make_chain(3, start=1)
 
         zipper = ZipperService(tree)
         traversal = TraversalService(tree)
@@ -309,10 +535,7 @@ class TestLinkBuilderEdgeCases:
 
     def test_links_for_wide_tree(self) -> None:
         """Test links for a tree with many siblings."""
-        tree = TreeService()
-        tree.create_node("root", "Root")
-        for i in range(5):
-            tree.create_node(f"child-{i}", f"Child {i}", parent_id="root")
+        tree = make_siblings(5)
 
         zipper = ZipperService(tree)
         traversal = TraversalService(tree)
@@ -326,6 +549,19 @@ class TestLinkBuilderEdgeCases:
         assert "right" in links
         assert links["right"].href == "child-3"
 
+    def test_children_link_for_max_length_id(self) -> None:
+        """Test that a max-length node ID still gets a children link."""
+        node_id = "x" * 255
+        tree = TreeService()
+        tree.create_node(node_id, "Long")
+        tree.create_node("child", "Child", parent_id=node_id)
+        builder = LinkBuilder(tree, ZipperService(tree), TraversalService(tree))
+
+        children_link = builder.build_links(node_id)["children"]
+        assert children_link.href == f"{node_id}/children"
+        # The link must also satisfy its own schema, since intern skips validation
+        assert Link.model_validate(children_link.model_dump()) == children_link
+
     def test_all_links_have_href(self, sample_tree: tuple[TreeService, LinkBuilder]) -> None:
         """Test that all generated links have href."""
         _, builder = sample_tree
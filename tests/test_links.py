@@ -35,26 +35,23 @@ class TestLink:
         assert any(e["loc"] == ("href",) for e in errors)
 
     def test_href_empty_string_invalid(self) -> None:
-        """Test that empty href is invalid (NodeId validation)."""
+        """Test that empty href is invalid."""
         with pytest.raises(ValidationError) as exc_info:
             Link(href="")
 
         errors = exc_info.value.errors()
         assert any(e["loc"] == ("href",) for e in errors)
 
-    def test_href_too_long_invalid(self) -> None:
-        """Test that href longer than 255 chars is invalid (NodeId validation)."""
-        with pytest.raises(ValidationError) as exc_info:
-            Link(href="x" * 256)
-
-        errors = exc_info.value.errors()
-        assert any(e["loc"] == ("href",) for e in errors)
+    def test_href_longer_than_node_id_valid(self) -> None:
+        """Test that href is not held to the NodeId limit, since it also carries URLs."""
+        href = "x" * 255 + "/children"
+        link = Link(href=href)
 
-    def test_href_at_max_length_valid(self) -> None:
-        """Test that href at exactly 255 chars is valid."""
-        link = Link(href="x" * 255)
+        assert link.href == href
 
-        assert len(link.href) == 255
+    def test_href_schema_has_no_node_id_limit(self) -> None:
+        """Test that the published schema allows the children URLs that are sent."""
+        assert "maxLength" not in Link.model_json_schema()["properties"]["href"]
 
     def test_title_can_be_none(self) -> None:
         """Test that title can be explicitly set to None."""
@@ -128,3 +125,18 @@ class TestLink:
 
         assert link1 != link2
         assert link1 != link3
+
+    def test_link_is_frozen(self) -> None:
+        """Test that links cannot be modified after creation."""
+        link = Link(href="node-1", title="Test")
+
+        with pytest.raises(ValidationError):
+            link.href = "node-2"
+
+    def test_intern_reuses_identical_links(self) -> None:
+        """Test that interning returns one shared object per (href, title)."""
+        link = Link.intern("node-1", "Test")
+
+        assert Link.intern("node-1", "Test") is link
+        assert Link.intern("node-1", "Other") is not link
+        assert link == Link(href="node-1", title="Test")
@@ -204,3 +204,11 @@ class TestNode:
         json_data = node.model_dump(mode="json")
         assert isinstance(json_data["created_at"], str)
         assert isinstance(json_data["updated_at"], str)
+
+    def test_node_is_frozen(self) -> None:
+        """Test that nodes cannot be modified in place (use model_copy instead)."""
+        now = datetime.now()
+        node = Node(id="node-1", description="Test", created_at=now, updated_at=now)
+
+        with pytest.raises(ValidationError):
+            node.description = "Changed"
@@ -1,33 +1,24 @@
 """Tests for TraversalService."""
 
+import sys
+
 import pytest
 
+from tests._factories import make_chain, make_siblings
 from tree.services.traversal import TraversalService
-from tree.services.tree import TreeService
+from tree.services.tree import TreeNotFoundError, TreeService
+
+
+@pytest.fixture(scope="module")
+def sample_tree(sample_tree_service: TreeService) -> tuple[TreeService, TraversalService]:
+    """Wrap the shared, read-only sample tree in a TraversalService."""
+    return sample_tree_service, TraversalService(sample_tree_service)
 
 
 @pytest.fixture
-def sample_tree() -> tuple[TreeService, TraversalService]:
-    """Create a sample tree for testing.
-
-    Structure:
-        root
-        ├── a
-        │   ├── a1
-        │   └── a2
-        └── b
-            └── b1
-    """
-    tree = TreeService()
-    tree.create_node("root", "Root")
-    tree.create_node("a", "A", parent_id="root")
-    tree.create_node("b", "B", parent_id="root")
-    tree.create_node("a1", "A1", parent_id="a")
-    tree.create_node("a2", "A2", parent_id="a")
-    tree.create_node("b1", "B1", parent_id="b")
-
-    traversal = TraversalService(tree)
-    return tree, traversal
+def fresh_sample_tree(fresh_tree_service: TreeService) -> tuple[TreeService, TraversalService]:
+    """Wrap a private sample tree in a TraversalService for tests that mutate it."""
+    return fresh_tree_service, TraversalService(fresh_tree_service)
 
 
 class TestDFSTraversal:
@@ -122,6 +113,15 @@ class TestDFSTraversal:
         # DFS from 'a' continues: a, a1, a2, b, b1
         assert node_ids == ["a", "a1", "a2", "b", "b1"]
 
+    def test_traverse_dfs_from_nonexistent_node_fails(
+        self, sample_tree: tuple[TreeService, TraversalService]
+    ) -> None:
+        """Test that DFS traversal from an unknown node raises."""
+        _, traversal = sample_tree
+
+        with pytest.raises(TreeNotFoundError):
+            list(traversal.traverse_dfs("nonexistent"))
+
 
 class TestBFSTraversal:
     """Test breadth-first traversal."""
@@ -182,10 +182,7 @@ class TestTraversalOnDifferentTrees:
 
     def test_traversal_on_linear_tree(self) -> None:
         """Test traversal on a linear tree (linked list)."""
-        tree = TreeService()
-        tree.create_node("1", "Node 1")
-        tree.create_node("2", "Node 2", parent_id="1")
-        tree.create_node("3", "Node 3", parent_id="2")
+        tree = make_chain(3, start=1)
 
         traversal = TraversalService(tree)
 
@@ -196,6 +193,18 @@ class TestTraversalOnDifferentTrees:
         assert dfs_nodes == ["1", "2", "3"]
         assert bfs_nodes == ["1", "2", "3"]
 
+    def test_traversal_on_deep_chain(self) -> None:
+        """Test traversal on a chain deeper than the recursion limit."""
+        depth = sys.getrecursionlimit() + 100
+        traversal = TraversalService(make_chain(depth))
+
+        last = str(depth - 1)
+        assert [n.id for n in traversal.traverse_dfs("0")][-1] == last
+        assert [n.id for n in traversal.traverse_bfs("0")][-1] == last
+        prev_node = traversal.compute_prev_dfs(last)
+        assert prev_node is not None
+        assert prev_node.id == str(depth - 2)
+
     def test_traversal_on_single_node(self) -> None:
         """Test traversal on a single node."""
         tree = TreeService()
@@ -213,10 +222,7 @@ class TestTraversalOnDifferentTrees:
 
     def test_traversal_on_wide_tree(self) -> None:
         """Test traversal on a wide tree (many siblings)."""
-        tree = TreeService()
-        tree.create_node("root", "Root")
-        for i in range(5):
-            tree.create_node(f"child-{i}", f"Child {i}", parent_id="root")
+        tree = make_siblings(5)
 
         traversal = TraversalService(tree)
 
@@ -230,3 +236,78 @@ class TestTraversalOnDifferentTrees:
         # BFS: root, then all children in order (same as DFS for depth 1)
         assert bfs_nodes[0] == "root"
         assert bfs_nodes[1:] == [f"child-{i}" for i in range(5)]
+
+
+class TestTraversalIndices:
+    """Test that precomputed successor/predecessor indices track tree changes."""
+
+    def test_indices_refresh_after_create(
+        self, fresh_sample_tree: tuple[TreeService, TraversalService]
+    ) -> None:
+        """Test that a new node shows up in next/prev links after it is created."""
+        tree, traversal = fresh_sample_tree
+        assert traversal.compute_next_dfs("b1") is None
+
+        tree.create_node("b2", "B2", parent_id="b")
+
+        next_node = traversal.compute_next_dfs("b1")
+        assert next_node is not None
+        assert next_node.id == "b2"
+        prev_node = traversal.compute_prev_dfs("b2")
+        assert prev_node is not None
+        assert prev_node.id == "b1"
+
+    def test_indices_refresh_after_move(
+        self, fresh_sample_tree: tuple[TreeService, TraversalService]
+    ) -> None:
+        """Test that moving a subtree reorders the BFS successor links."""
+        tree, traversal = fresh_sample_tree
+        next_node = traversal.compute_next_bfs("b")
+        assert next_node is not None
+        assert next_node.id == "a1"
+
+        tree.move_node("a", "b")
+
+        next_node = traversal.compute_next_bfs("b")
+        assert next_node is not None
+        assert next_node.id == "b1"
+
+    def test_next_dfs_raises_for_deleted_node(
+        self, fresh_sample_tree: tuple[TreeService, TraversalService]
+    ) -> None:
+        """Test that lookups for a deleted node fail rather than use stale indices."""
+        tree, traversal = fresh_sample_tree
+        traversal.compute_next_dfs("a1")
+
+        tree.delete_node("a1")
+
+        with pytest.raises(TreeNotFoundError):
+            traversal.compute_next_dfs("a1")
+
+    def test_write_during_rebuild_leaves_indices_stale(
+        self,
+        fresh_sample_tree: tuple[TreeService, TraversalService],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that a node added mid-rebuild is picked up by the next lookup."""
+        tree, traversal = fresh_sample_tree
+        get_child_ids = tree.get_child_ids
+        writes: list[str] = []
+
+        def get_child_ids_with_write(node_id: str) -> list[str]:
+            # Simulate another request inserting a3 the first time the walk reaches b1
+            if node_id == "b1" and not writes:
+                writes.append(node_id)
+                tree.create_node("a3", "A3", parent_id="a")
+            return get_child_ids(node_id)
+
+        monkeypatch.setattr(tree, "get_child_ids", get_child_ids_with_write)
+        traversal.compute_next_dfs("root")
+        monkeypatch.undo()
+
+        next_node = traversal.compute_next_dfs("a2")
+        assert next_node is not None
+        assert next_node.id == "a3"
+        next_node = traversal.compute_next_dfs("a3")
+        assert next_node is not None
+        assert next_node.id == "b"
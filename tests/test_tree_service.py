@@ -1,7 +1,10 @@
 """Tests for TreeService."""
 
+import sys
+
 import pytest
 
+from tests._factories import make_chain, make_siblings
 from tree.services.tree import (
     CircularReferenceError,
     InvalidOperationError,
@@ -68,6 +71,82 @@ class TestTreeServiceBasics:
         with pytest.raises(InvalidOperationError, match="Root node already exists"):
             tree.create_node("root2", "Another root")
 
+    def test_created_node_ids_are_interned(self) -> None:
+        """Test that stored node IDs are interned, whichever way they were created."""
+        tree = TreeService()
+        tree.create_node("".join(["ro", "ot"]), "Root")
+        tree.bulk_create("root", [("".join(["chi", "ld"]), "Child", {})])
+
+        assert tree.get_node("root").id is sys.intern("root")
+        assert tree.get_node("child").id is sys.intern("child")
+
+
+class TestTreeServiceBulkCreate:
+    """Test batch child creation."""
+
+    def test_bulk_create_children(self) -> None:
+        """Test creating several children in one call."""
+        tree = TreeService()
+        tree.create_node("root", "Root")
+
+        created = tree.bulk_create(
+            "root",
+            [("child-1", "Child 1", {}), ("child-2", "Child 2", {"key": "value"})],
+        )
+
+        assert [n.id for n in created] == ["child-1", "child-2"]
+        assert [c.id for c in tree.get_children("root")] == ["child-1", "child-2"]
+        assert tree.get_node("child-2").metadata == {"key": "value"}
+        assert tree.get_node("child-1").parent_id == "root"
+        assert tree.get_node("root").is_leaf is False
+
+    def test_bulk_create_appends_after_existing_children(self) -> None:
+        """Test that bulk-created children follow existing siblings."""
+        tree = TreeService()
+        tree.create_node("root", "Root")
+        tree.create_node("child-1", "Child 1", parent_id="root")
+
+        tree.bulk_create("root", [("child-2", "Child 2", {})])
+
+        assert [c.id for c in tree.get_children("root")] == ["child-1", "child-2"]
+
+    def test_bulk_create_empty_list_is_noop(self) -> None:
+        """Test that an empty batch leaves the parent a leaf."""
+        tree = TreeService()
+        tree.create_node("root", "Root")
+
+        assert tree.bulk_create("root", []) == []
+        assert tree.get_node("root").is_leaf is True
+
+    def test_bulk_create_with_invalid_parent_fails(self) -> None:
+        """Test that bulk creation under a missing parent fails."""
+        tree = TreeService()
+
+        with pytest.raises(TreeNotFoundError, match="not found"):
+            tree.bulk_create("nonexistent", [("child-1", "Child 1", {})])
+
+    def test_bulk_create_duplicate_fails_atomically(self) -> None:
+        """Test that a batch with an existing ID inserts nothing."""
+        tree = TreeService()
+        tree.create_node("root", "Root")
+        tree.create_node("child-1", "Child 1", parent_id="root")
+
+        with pytest.raises(InvalidOperationError, match="already exists"):
+            tree.bulk_create("root", [("child-2", "Child 2", {}), ("child-1", "Again", {})])
+
+        assert tree.node_count() == 2
+        assert [c.id for c in tree.get_children("root")] == ["child-1"]
+
+    def test_bulk_create_repeated_id_in_batch_fails(self) -> None:
+        """Test that repeating an ID within one batch fails."""
+        tree = TreeService()
+        tree.create_node("root", "Root")
+
+        with pytest.raises(InvalidOperationError, match="already exists"):
+            tree.bulk_create("root", [("child-1", "Child 1", {}), ("child-1", "Again", {})])
+
+        assert tree.node_count() == 1
+
 
 class TestTreeServiceRetrieval:
     """Test node retrieval operations."""
@@ -107,6 +186,27 @@ class TestTreeServiceRetrieval:
         children = tree.get_children("root")
         assert children == []
 
+    def test_get_child_ids(self) -> None:
+        """Test getting child IDs in order, as a copy of the internal list."""
+        tree = make_siblings(3)
+
+        child_ids = tree.get_child_ids("root")
+        assert child_ids == ["child-0", "child-1", "child-2"]
+
+        child_ids.clear()
+        assert tree.get_child_ids("root") == ["child-0", "child-1", "child-2"]
+
+    def test_get_children_with_counts(self, sample_tree_service: TreeService) -> None:
+        """Test pairing each child with its own child count in one call."""
+        tree = sample_tree_service
+
+        pairs = tree.get_children_with_counts("root")
+        assert [(child.id, count) for child, count in pairs] == [("a", 2), ("b", 1)]
+        assert tree.get_children_with_counts("a1") == []
+
+        with pytest.raises(TreeNotFoundError):
+            tree.get_children_with_counts("nonexistent")
+
     def test_get_siblings(self) -> None:
         """Test getting siblings of a node."""
         tree = TreeService()
@@ -164,6 +264,85 @@ class TestTreeServiceRetrieval:
         assert root is None
 
 
+class TestTreeServiceSiblingLinks:
+    """Test first-child and previous/next sibling lookups."""
+
+    def test_get_first_child(self) -> None:
+        """Test getting the first child, or None for a leaf."""
+        tree = make_siblings(3)
+
+        assert tree.get_first_child("root") == tree.get_node("child-0")
+        assert tree.get_first_child("child-0") is None
+
+    def test_sibling_links_follow_insertion_order(self) -> None:
+        """Test that siblings are linked in the order they were created."""
+        tree = make_siblings(3)
+
+        assert tree.get_prev_sibling("child-0") is None
+        assert tree.get_next_sibling("child-0") == tree.get_node("child-1")
+        assert tree.get_prev_sibling("child-2") == tree.get_node("child-1")
+        assert tree.get_next_sibling("child-2") is None
+
+    def test_root_has_no_siblings(self) -> None:
+        """Test that root has neither a previous nor a next sibling."""
+        tree = make_siblings(1)
+
+        assert tree.get_prev_sibling("root") is None
+        assert tree.get_next_sibling("root") is None
+
+    def test_delete_makes_neighbours_adjacent(self) -> None:
+        """Test that deleting a middle child leaves its neighbours next to each other."""
+        tree = make_siblings(3)
+
+        tree.delete_node("child-1")
+
+        assert tree.get_next_sibling("child-0") == tree.get_node("child-2")
+        assert tree.get_prev_sibling("child-2") == tree.get_node("child-0")
+
+    def test_move_updates_siblings_under_both_parents(self) -> None:
+        """Test that moving a node drops it from its old siblings and appends it to new ones."""
+        tree = make_siblings(3)
+        tree.create_node("grandchild", "Grandchild", parent_id="child-2")
+
+        tree.move_node("child-0", "child-2")
+
+        assert tree.get_prev_sibling("child-1") is None
+        assert tree.get_prev_sibling("child-0") == tree.get_node("grandchild")
+        assert tree.get_next_sibling("child-0") is None
+
+    def test_sibling_lookup_for_nonexistent_node_fails(self) -> None:
+        """Test that sibling lookups reject unknown nodes."""
+        tree = TreeService()
+
+        with pytest.raises(TreeNotFoundError):
+            tree.get_prev_sibling("nonexistent")
+        with pytest.raises(TreeNotFoundError):
+            tree.get_next_sibling("nonexistent")
+
+    def test_sibling_index_follows_deletes_and_moves(self) -> None:
+        """Test that sibling positions close up after a removal and extend on a move."""
+        tree = make_siblings(4)
+        assert [tree.get_sibling_index(f"child-{i}") for i in range(4)] == [0, 1, 2, 3]
+        assert tree.get_sibling_index("root") == 0
+
+        tree.delete_node("child-1")
+        assert [tree.get_sibling_index(c) for c in ("child-0", "child-2", "child-3")] == [0, 1, 2]
+
+        tree.move_node("child-0", "child-3")
+        assert tree.get_sibling_index("child-2") == 0
+        assert tree.get_sibling_index("child-3") == 1
+        assert tree.get_sibling_index("child-0") == 0
+
+    def test_get_child_count(self, sample_tree_service: TreeService) -> None:
+        """Test counting children without materializing them."""
+        tree = sample_tree_service
+
+        assert tree.get_child_count("root") == 2
+        assert tree.get_child_count("a1") == 0
+        with pytest.raises(TreeNotFoundError):
+            tree.get_child_count("nonexistent")
+
+
 class TestTreeServiceUpdate:
     """Test node update operations."""
 
@@ -275,6 +454,46 @@ class TestTreeServiceDelete:
         assert len(children) == 2
         assert {c.id for c in children} == {"child-1", "child-3"}
 
+    def test_delete_deep_chain_does_not_recurse(self) -> None:
+        """Test deleting a subtree deeper than the recursion limit."""
+        depth = sys.getrecursionlimit() + 100
+        tree = make_chain(depth)
+
+        tree.delete_node("1")
+
+        assert tree.node_count() == 1
+        assert tree.get_node("0").is_leaf is True
+
+    def test_delete_descendants(self, fresh_tree_service: TreeService) -> None:
+        """Test deleting every descendant at once leaves the node a leaf."""
+        tree = fresh_tree_service
+        version = tree.version
+
+        node = tree.delete_descendants("a")
+
+        assert node.is_leaf is True
+        assert tree.get_node("a") is node
+        assert tree.get_children("a") == []
+        assert tree.node_count() == 4
+        assert tree.version == version + 1
+        # Siblings of the collapsed node keep their links
+        assert tree.get_next_sibling("a") == tree.get_node("b")
+
+    def test_delete_descendants_of_leaf_is_noop(self, fresh_tree_service: TreeService) -> None:
+        """Test deleting descendants of a leaf leaves the tree untouched."""
+        tree = fresh_tree_service
+        version = tree.version
+
+        assert tree.delete_descendants("a1") is tree.get_node("a1")
+        assert tree.version == version
+
+    def test_delete_descendants_of_nonexistent_node_fails(self) -> None:
+        """Test deleting descendants of a nonexistent node raises error."""
+        tree = TreeService()
+
+        with pytest.raises(TreeNotFoundError):
+            tree.delete_descendants("nonexistent")
+
 
 class TestTreeServiceMove:
     """Test node move operations."""
@@ -406,3 +625,45 @@ class TestTreeServiceComplex:
 
         tree.update_node("root", description="Updated")
         assert tree.node_count() == 2
+
+
+class TestTreeServiceVersion:
+    """Test the mutation version counter."""
+
+    def test_version_starts_at_zero(self) -> None:
+        """Test that a new tree starts at version 0."""
+        tree = TreeService()
+        assert tree.version == 0
+
+    def test_every_mutation_bumps_version(self) -> None:
+        """Test that create, bulk create, update, move and delete all bump the version."""
+        tree = TreeService()
+        versions = [tree.version]
+
+        tree.create_node("root", "Root")
+        versions.append(tree.version)
+        tree.bulk_create("root", [("a", "A", {}), ("b", "B", {})])
+        versions.append(tree.version)
+        tree.update_node("a", description="Updated")
+        versions.append(tree.version)
+        tree.move_node("b", "a")
+        versions.append(tree.version)
+        tree.delete_node("b")
+        versions.append(tree.version)
+
+        assert versions == sorted(set(versions))
+
+    def test_reads_and_failed_mutations_keep_version(self) -> None:
+        """Test that reads and rejected mutations leave the version unchanged."""
+        tree = TreeService()
+        tree.create_node("root", "Root")
+        version = tree.version
+
+        tree.get_node("root")
+        tree.get_children("root")
+        with pytest.raises(InvalidOperationError):
+            tree.create_node("root", "Duplicate", parent_id="root")
+        with pytest.raises(InvalidOperationError):
+            tree.delete_node("root")
+
+        assert tree.version == version
@@ -1,8 +1,11 @@
 """Tests for type aliases and validation."""
 
+from datetime import datetime
+
 import pytest
 from pydantic import BaseModel, Field, ValidationError
 
+from tree.models import Breadcrumb, Link, Node
 from tree.types import NodeId
 
 
@@ -140,10 +143,6 @@ class TestNodeIdTypeAlias:
 
     def test_node_id_consistency_across_models(self) -> None:
         """Test that NodeId is consistent across different model types."""
-        from datetime import datetime
-
-        from tree.models import Breadcrumb, Link, Node
-
         # All these should accept the same ID format
         test_id = "consistent-id-123"
 
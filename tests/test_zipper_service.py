@@ -1,33 +1,24 @@
 """Tests for ZipperService."""
 
+import sys
+
 import pytest
 
+from tests._factories import make_chain
 from tree.services.tree import InvalidOperationError, TreeNotFoundError, TreeService
 from tree.services.zipper import ZipperService
 
 
+@pytest.fixture(scope="module")
+def sample_tree(sample_tree_service: TreeService) -> tuple[TreeService, ZipperService]:
+    """Wrap the shared, read-only sample tree in a ZipperService."""
+    return sample_tree_service, ZipperService(sample_tree_service)
+
+
 @pytest.fixture
-def sample_tree() -> tuple[TreeService, ZipperService]:
-    """Create a sample tree for testing.
-
-    Structure:
-        root
-        ├── a
-        │   ├── a1
-        │   └── a2
-        └── b
-            └── b1
-    """
-    tree = TreeService()
-    tree.create_node("root", "Root")
-    tree.create_node("a", "A", parent_id="root")
-    tree.create_node("b", "B", parent_id="root")
-    tree.create_node("a1", "A1", parent_id="a")
-    tree.create_node("a2", "A2", parent_id="a")
-    tree.create_node("b1", "B1", parent_id="b")
-
-    zipper = ZipperService(tree)
-    return tree, zipper
+def fresh_sample_tree(fresh_tree_service: TreeService) -> tuple[TreeService, ZipperService]:
+    """Wrap a private sample tree in a ZipperService for tests that mutate it."""
+    return fresh_tree_service, ZipperService(fresh_tree_service)
 
 
 class TestZipperNavigation:
@@ -246,13 +237,30 @@ class TestZipperExpand:
         # Node should still be a leaf since no children were added
         assert expanded.is_leaf is True
 
+    def test_expand_with_clashing_id_creates_nothing(self) -> None:
+        """Test that one existing child ID rejects the whole expansion."""
+        tree = TreeService()
+        tree.create_node("root", "Root")
+        tree.create_node("leaf", "Leaf", parent_id="root")
+        zipper = ZipperService(tree)
+        version = tree.version
+
+        with pytest.raises(InvalidOperationError, match="already exists"):
+            zipper.expand("leaf", [("new-child", "New Child", {}), ("root", "Clash", {})])
+
+        assert tree.node_count() == 2
+        assert tree.get_node("leaf").is_leaf is True
+        assert tree.version == version
+
 
 class TestZipperCollapse:
     """Test collapse (zoom out) operation."""
 
-    def test_collapse_branch_node(self, sample_tree: tuple[TreeService, ZipperService]) -> None:
+    def test_collapse_branch_node(
+        self, fresh_sample_tree: tuple[TreeService, ZipperService]
+    ) -> None:
         """Test collapsing a branch node into a leaf."""
-        tree, zipper = sample_tree
+        tree, zipper = fresh_sample_tree
 
         # Collapse node 'a' which has children a1 and a2
         collapsed = zipper.collapse("a")
@@ -270,9 +278,11 @@ class TestZipperCollapse:
         with pytest.raises(TreeNotFoundError):
             tree.get_node("a2")
 
-    def test_collapse_with_summary(self, sample_tree: tuple[TreeService, ZipperService]) -> None:
+    def test_collapse_with_summary(
+        self, fresh_sample_tree: tuple[TreeService, ZipperService]
+    ) -> None:
         """Test collapsing with a summary description."""
-        _, zipper = sample_tree
+        _, zipper = fresh_sample_tree
 
         collapsed = zipper.collapse("a", summary="A (completed)")
 
@@ -310,6 +320,16 @@ class TestZipperCollapse:
         with pytest.raises(TreeNotFoundError):
             tree.get_node("a1a")
 
+    def test_collapse_deep_chain(self) -> None:
+        """Test collapsing a subtree deeper than the recursion limit."""
+        tree = make_chain(sys.getrecursionlimit() + 100)
+        zipper = ZipperService(tree)
+
+        collapsed = zipper.collapse("0")
+
+        assert collapsed.is_leaf is True
+        assert tree.node_count() == 1
+
 
 class TestZipperExpandCollapseCycle:
     """Test expand/collapse cycles."""
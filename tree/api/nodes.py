@@ -1,5 +1,8 @@
 """Node CRUD endpoints."""
 
+import threading
+from collections.abc import Mapping
+
 from fastapi import APIRouter, Depends, HTTPException, Response, status
 
 from tree.dependencies import (
@@ -8,6 +11,7 @@ from tree.dependencies import (
     get_tree_service,
     get_zipper_service,
 )
+from tree.models import Context, Link, Node
 from tree.models.responses import (
     CollapseRequest,
     ExpandRequest,
@@ -27,6 +31,9 @@ from tree.utils.link_builder import LinkBuilder
 
 router = APIRouter()
 
+# Serializes auto-creation of the root so concurrent first requests create it once
+_root_lock = threading.Lock()
+
 
 def build_node_response(
     node_id: NodeId,
@@ -35,10 +42,19 @@ def build_node_response(
     link_builder: LinkBuilder,
 ) -> NodeResponse:
     """Build a complete NodeResponse with context and links."""
-    node = tree.get_node(node_id)
-    context = context_builder.build_context(node_id)
-    links = link_builder.build_links(node_id)
+    return build_node_response_from_node(
+        tree.get_node(node_id),
+        context_builder.build_context(node_id),
+        link_builder.build_links(node_id),
+    )
 
+
+def build_node_response_from_node(
+    node: Node,
+    context: Context,
+    links: Mapping[str, Link],
+) -> NodeResponse:
+    """Build a NodeResponse from an already-fetched node and its context and links."""
     return NodeResponse(
         id=node.id,
         parent_id=node.parent_id,
@@ -48,7 +64,7 @@ def build_node_response(
         created_at=node.created_at,
         updated_at=node.updated_at,
         context=context,
-        links=links,
+        links=dict(links),
     )
 
 
@@ -63,9 +79,12 @@ def get_root(
 
     # Auto-create root if it doesn't exist
     if root is None:
-        root = tree.create_node("root", "Root")
+        with _root_lock:
+            root = tree.get_root() or tree.create_node("root", "Root")
 
-    return build_node_response("root", tree, context_builder, link_builder)
+    return build_node_response_from_node(
+        root, context_builder.build_context(root.id), link_builder.build_links(root.id)
+    )
 
 
 @router.get("/{node_id}", response_model=NodeResponse)
@@ -91,9 +110,13 @@ def get_children(
 ) -> list[NodeResponse]:
     """Get all children of a node."""
     try:
-        children = tree.get_children(node_id)
+        # Siblings share one parent walk for breadcrumbs and one pass for links; the
+        # children are read once so contexts and links cover the same list
+        pairs = context_builder.build_child_contexts(node_id)
+        links = link_builder.build_links_batch(child.id for child, _ in pairs)
         return [
-            build_node_response(child.id, tree, context_builder, link_builder) for child in children
+            build_node_response_from_node(child, context, links[child.id])
+            for child, context in pairs
         ]
     except TreeNotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -175,7 +198,8 @@ def expand_node(
     """Expand a leaf node into a branch with children."""
     try:
         children_data = [
-            (child.id, child.description, child.metadata) for child in expand_data.children
+            (child["id"], child["description"], child.get("metadata", {}))
+            for child in expand_data.children
         ]
         zipper.expand(node_id, children_data)
         return build_node_response(node_id, tree, context_builder, link_builder)
@@ -1,5 +1,7 @@
 """Configuration for the Tree API."""
 
+from functools import lru_cache
+
 from pydantic_settings import BaseSettings
 
 
@@ -29,5 +31,7 @@ class Settings(BaseSettings):
         case_sensitive = False
 
 
-# Global settings instance
-settings = Settings()
+@lru_cache
+def get_settings() -> Settings:
+    """Get the application settings, reading the environment on first call only."""
+    return Settings()
@@ -1,5 +1,7 @@
 """Context models for zipper navigation."""
 
+import weakref
+
 from pydantic import BaseModel, Field
 
 from tree.types import NodeId
@@ -11,6 +13,21 @@ class Breadcrumb(BaseModel):
     id: NodeId = Field(..., description="Node ID")
     description: str = Field(..., description="Node description")
 
+    model_config = {"frozen": True}
+
+    @classmethod
+    def intern(cls, id: NodeId, description: str) -> "Breadcrumb":
+        """Get a shared Breadcrumb for (id, description), creating it on first use.
+
+        Like Link.intern, the values are trusted node fields and are not re-validated.
+        """
+        key = (id, description)
+        breadcrumb = _interned_breadcrumbs.get(key)
+        if breadcrumb is None:
+            breadcrumb = cls.model_construct(id=id, description=description)
+            _interned_breadcrumbs[key] = breadcrumb
+        return breadcrumb
+
 
 class Context(BaseModel):
     """Context information about a node's position in the tree (zipper context)."""
@@ -20,6 +37,15 @@ class Context(BaseModel):
     total_siblings: int = Field(..., ge=1, description="Total number of siblings including self")
     has_children: bool = Field(..., description="Whether this node has children")
     children_count: int = Field(..., ge=0, description="Number of direct children")
-    breadcrumbs: list[Breadcrumb] = Field(
-        default_factory=list, description="Path from root to parent of this node"
+    breadcrumbs: tuple[Breadcrumb, ...] = Field(
+        default_factory=tuple, description="Path from root to parent of this node"
     )
+
+    # Built contexts are cached and handed to every caller, so they must not change
+    model_config = {"frozen": True}
+
+
+# Keyed by description as well as ID, so renaming a node never serves a stale crumb
+_interned_breadcrumbs: weakref.WeakValueDictionary[tuple[NodeId, str], Breadcrumb] = (
+    weakref.WeakValueDictionary()
+)
@@ -1,14 +1,36 @@
 """HATEOAS link models for hypermedia navigation."""
 
-from pydantic import BaseModel, Field
+import weakref
 
-from tree.types import NodeId
+from pydantic import BaseModel, Field
 
 
 class Link(BaseModel):
     """A hypermedia link with optional metadata."""
 
-    href: NodeId = Field(..., description="Node ID or URL of the linked resource")
+    # Not a NodeId: hrefs also carry "<id>/children" URLs, which can exceed the ID limit
+    href: str = Field(..., min_length=1, description="Node ID or URL of the linked resource")
     title: str | None = Field(None, description="Human-readable description of the link")
 
-    model_config = {"extra": "allow"}  # Allow additional fields if needed
+    # Allow additional fields if needed; frozen so identical links can be shared
+    model_config = {"extra": "allow", "frozen": True}
+
+    @classmethod
+    def intern(cls, href: str, title: str | None = None) -> "Link":
+        """Get a shared Link for (href, title), creating it on first use.
+
+        The values are trusted rather than validated: callers pass IDs and descriptions
+        taken from nodes that were validated when they were created.
+        """
+        key = (href, title)
+        link = _interned_links.get(key)
+        if link is None:
+            link = cls.model_construct(href=href, title=title)
+            _interned_links[key] = link
+        return link
+
+
+# Links stay interned only while something (e.g. a LinkBuilder cache) still references them
+_interned_links: weakref.WeakValueDictionary[tuple[str, str | None], Link] = (
+    weakref.WeakValueDictionary()
+)
@@ -1,7 +1,7 @@
 """API response models."""
 
 from datetime import datetime
-from typing import Any
+from typing import Annotated, Any, NotRequired, TypedDict
 
 from pydantic import BaseModel, Field
 
@@ -39,10 +39,21 @@ class NodeUpdate(BaseModel):
     metadata: dict[str, Any] | None = None
 
 
+class ChildSpec(TypedDict):
+    """A child to create during expand; same fields and limits as NodeCreate.
+
+    Validated as a plain dict, so wide expansions skip one model instance per child.
+    """
+
+    id: NodeId
+    description: Annotated[str, Field(min_length=1, max_length=1000)]
+    metadata: NotRequired[dict[str, Any]]
+
+
 class ExpandRequest(BaseModel):
     """Request body for expanding a leaf node."""
 
-    children: list[NodeCreate]
+    children: list[ChildSpec]
 
 
 class CollapseRequest(BaseModel):
@@ -1,19 +1,82 @@
 """Traversal service for DFS and BFS tree traversal."""
 
-from collections import deque
-from collections.abc import Iterator
+from collections.abc import Iterator, Mapping
+from itertools import islice
+from types import MappingProxyType
+from typing import NamedTuple
 
 from tree.models import Node
 from tree.services.tree import TreeService
 from tree.types import NodeId
 
 
+class _TraversalIndices(NamedTuple):
+    """Successor/predecessor indices for one tree version, never changed once built."""
+
+    version: int
+    dfs_order: tuple[NodeId, ...]
+    dfs_position: Mapping[NodeId, int]
+    bfs_order: tuple[NodeId, ...]
+    bfs_position: Mapping[NodeId, int]
+
+
+_NO_INDICES = _TraversalIndices(-1, (), MappingProxyType({}), (), MappingProxyType({}))
+
+
 class TraversalService:
     """Tree traversal algorithms (DFS and BFS)."""
 
     def __init__(self, tree: TreeService) -> None:
         """Initialize traversal service with a tree."""
         self.tree = tree
+        # Replaced wholesale on rebuild, so concurrent readers never pair the position
+        # map of one version with the order of another
+        self._indices = _NO_INDICES
+
+    def _ensure_indices(self) -> _TraversalIndices:
+        """Get the successor/predecessor indices, rebuilding them if the tree has changed.
+
+        One preorder walk and one level-order walk from the root lay out both
+        orders, so each next/prev lookup afterwards is a position lookup.
+        """
+        # Read the version before walking, so a write landing mid-rebuild leaves the
+        # indices marked stale rather than current
+        version = self.tree.version
+        indices = self._indices
+        if indices.version == version:
+            return indices
+
+        root = self.tree.get_root()
+        if root is None:
+            indices = _NO_INDICES._replace(version=version)
+        else:
+            get_child_ids = self.tree.get_child_ids
+
+            # Preorder: pop from a stack, pushing children in reverse so the first is visited next
+            preorder: list[NodeId] = []
+            stack = [root.id]
+            while stack:
+                current_id = stack.pop()
+                preorder.append(current_id)
+                stack.extend(reversed(get_child_ids(current_id)))
+
+            # Level order: the list doubles as its own queue
+            level_order = [root.id]
+            for current_id in level_order:
+                level_order.extend(get_child_ids(current_id))
+
+            # Position maps are built by zip/range, without per-node Python code
+            indices = _TraversalIndices(
+                version,
+                tuple(preorder),
+                MappingProxyType(dict(zip(preorder, range(len(preorder))))),
+                tuple(level_order),
+                MappingProxyType(dict(zip(level_order, range(len(level_order))))),
+            )
+
+        # Published in one assignment, so readers see either the old snapshot or the new
+        self._indices = indices
+        return indices
 
     def compute_next_dfs(self, node_id: NodeId) -> Node | None:
         """Compute the next node in depth-first order.
@@ -26,85 +89,31 @@ class TraversalService:
         Returns:
             Next node in DFS order, or None if no next node
         """
-        node = self.tree.get_node(node_id)
-
-        # Try down (first child)
-        children = self.tree.get_children(node_id)
-        if children:
-            return children[0]
-
-        # Try right (next sibling)
-        if node.parent_id is not None:
-            siblings = self.tree.get_siblings(node_id)
-            try:
-                current_index = next(i for i, s in enumerate(siblings) if s.id == node_id)
-                if current_index < len(siblings) - 1:
-                    return siblings[current_index + 1]
-            except StopIteration:
-                pass
-
-        # Go up and try right
-        current = node
-        while current.parent_id is not None:
-            parent = self.tree.get_parent(current.id)
-            if parent is None:
-                break
-
-            # Try to get next sibling of parent
-            parent_siblings = self.tree.get_siblings(parent.id)
-            try:
-                parent_index = next(i for i, s in enumerate(parent_siblings) if s.id == parent.id)
-                if parent_index < len(parent_siblings) - 1:
-                    return parent_siblings[parent_index + 1]
-            except StopIteration:
-                pass
-
-            current = parent
-
-        return None
+        self.tree.get_node(node_id)  # Verify node exists
+        indices = self._ensure_indices()
+        position = indices.dfs_position.get(node_id)
+        if position is None or position + 1 >= len(indices.dfs_order):
+            return None
+        return self.tree.get_node(indices.dfs_order[position + 1])
 
     def compute_prev_dfs(self, node_id: NodeId) -> Node | None:
         """Compute the previous node in depth-first order.
 
+        This is the rightmost descendant of the left sibling, or the parent if
+        there is no left sibling.
+
         Args:
             node_id: Current node ID
 
         Returns:
             Previous node in DFS order, or None if no previous node
         """
-        node = self.tree.get_node(node_id)
-
-        # If this is root, no previous
-        if node.parent_id is None:
-            return None
-
-        # Try left (previous sibling)
-        siblings = self.tree.get_siblings(node_id)
-        try:
-            current_index = next(i for i, s in enumerate(siblings) if s.id == node_id)
-        except StopIteration:
+        self.tree.get_node(node_id)  # Verify node exists
+        indices = self._ensure_indices()
+        position = indices.dfs_position.get(node_id)
+        if position is None or position == 0:
             return None
-
-        if current_index > 0:
-            # Go to rightmost descendant of left sibling
-            left_sibling = siblings[current_index - 1]
-            return self._rightmost_descendant(left_sibling.id)
-
-        # No left sibling, go to parent
-        return self.tree.get_parent(node_id)
-
-    def _rightmost_descendant(self, node_id: NodeId) -> Node:
-        """Get the rightmost descendant of a node (for prev_dfs)."""
-        current = self.tree.get_node(node_id)
-
-        while not current.is_leaf:
-            children = self.tree.get_children(current.id)
-            if not children:
-                break
-            # Go to last child
-            current = children[-1]
-
-        return current
+        return self.tree.get_node(indices.dfs_order[position - 1])
 
     def compute_next_bfs(self, node_id: NodeId) -> Node | None:
         """Compute the next node in breadth-first order.
@@ -115,29 +124,11 @@ class TraversalService:
         Returns:
             Next node in BFS order, or None if no next node
         """
-        # Do a BFS traversal and find the current node, then return the next one
-        root = self.tree.get_root()
-        if root is None:
+        indices = self._ensure_indices()
+        position = indices.bfs_position.get(node_id)
+        if position is None or position + 1 >= len(indices.bfs_order):
             return None
-
-        queue: deque[Node] = deque([root])
-        found_current = False
-
-        while queue:
-            current = queue.popleft()
-
-            if found_current:
-                # This is the next node after the one we're looking for
-                return current
-
-            if current.id == node_id:
-                found_current = True
-
-            # Add children to queue
-            children = self.tree.get_children(current.id)
-            queue.extend(children)
-
-        return None
+        return self.tree.get_node(indices.bfs_order[position + 1])
 
     def traverse_dfs(self, start_node_id: NodeId) -> Iterator[Node]:
         """Generate all nodes in depth-first order starting from a node.
@@ -148,14 +139,17 @@ class TraversalService:
         Yields:
             Nodes in DFS order
         """
-        current_id: NodeId | None = start_node_id
-
-        while current_id is not None:
-            node = self.tree.get_node(current_id)
-            yield node
+        start_node = self.tree.get_node(start_node_id)
+        indices = self._ensure_indices()
+        position = indices.dfs_position.get(start_node_id)
+        if position is None:
+            yield start_node
+            return
 
-            next_node = self.compute_next_dfs(current_id)
-            current_id = next_node.id if next_node else None
+        # Scan the preorder layout from the start onwards; a rebuild mid-iteration swaps in
+        # a new snapshot rather than shifting positions in this one
+        for node_id in islice(indices.dfs_order, position, None):
+            yield self.tree.get_node(node_id)
 
     def traverse_bfs(self, start_node_id: NodeId) -> Iterator[Node]:
         """Generate all nodes in breadth-first order starting from a node.
@@ -166,13 +160,17 @@ class TraversalService:
         Yields:
             Nodes in BFS order
         """
-        start_node = self.tree.get_node(start_node_id)
-        queue: deque[Node] = deque([start_node])
-
-        while queue:
-            node = queue.popleft()
-            yield node
-
-            # Add children to queue
-            children = self.tree.get_children(node.id)
-            queue.extend(children)
+        self.tree.get_node(start_node_id)  # Verify node exists
+        indices = self._ensure_indices()
+
+        if indices.bfs_position.get(start_node_id) == 0:
+            # From the root, the precomputed level order is the answer; scan it directly
+            for node_id in indices.bfs_order:
+                yield self.tree.get_node(node_id)
+            return
+
+        # Otherwise walk the subtree by ID, with the list doubling as its own queue
+        order = [start_node_id]
+        for node_id in order:
+            yield self.tree.get_node(node_id)
+            order.extend(self.tree.get_child_ids(node_id))
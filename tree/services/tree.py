@@ -1,5 +1,6 @@
 """Tree service for managing nodes and tree structure."""
 
+import sys
 from datetime import datetime
 from typing import Any
 
@@ -33,6 +34,16 @@ class TreeService:
         self._nodes: dict[NodeId, Node] = {}
         self._children: dict[NodeId, list[NodeId]] = {}
         self._root_id: NodeId | None = None
+        # Position of each non-root node within its parent's _children list, so sibling
+        # lookups are one index away
+        self._child_index: dict[NodeId, int] = {}
+        # Bumped on every mutation so derived caches can tell when they are stale
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        """Monotonic counter that changes whenever the tree is modified."""
+        return self._version
 
     def create_node(
         self,
@@ -42,6 +53,8 @@ class TreeService:
         metadata: dict[str, Any] | None = None,
     ) -> Node:
         """Create a new node in the tree."""
+        # IDs are stored as dict keys in several maps; interning lets lookups match by identity
+        node_id = sys.intern(node_id)
         if node_id in self._nodes:
             raise InvalidOperationError(f"Node {node_id} already exists")
 
@@ -69,18 +82,78 @@ class TreeService:
             self._root_id = node_id
         else:
             # Add to parent's children
-            self._children[parent_id].append(node_id)
+            self._append_child(parent_id, node_id)
             # Parent is no longer a leaf
             parent = self._nodes[parent_id]
             self._nodes[parent_id] = parent.model_copy(update={"is_leaf": False, "updated_at": now})
 
+        self._version += 1
         return node
 
+    def bulk_create(
+        self,
+        parent_id: NodeId,
+        children: list[tuple[NodeId, str, dict[str, Any]]],
+    ) -> list[Node]:
+        """Create several children under one parent in a single pass.
+
+        All IDs are checked before anything is inserted, so a failing batch leaves
+        the tree unchanged. The parent is updated once rather than once per child.
+
+        Args:
+            parent_id: ID of the parent node
+            children: List of (id, description, metadata) tuples for children
+
+        Returns:
+            The created nodes, in the order given
+
+        Raises:
+            TreeNotFoundError: If the parent does not exist
+            InvalidOperationError: If any child ID already exists or is repeated
+        """
+        if parent_id not in self._nodes:
+            raise TreeNotFoundError(f"Parent node {parent_id} not found")
+
+        seen: set[NodeId] = set()
+        for child_id, _, _ in children:
+            if child_id in self._nodes or child_id in seen:
+                raise InvalidOperationError(f"Node {child_id} already exists")
+            seen.add(child_id)
+
+        if not children:
+            return []
+
+        now = datetime.now()
+        nodes = [
+            Node(
+                id=sys.intern(child_id),
+                parent_id=parent_id,
+                description=description,
+                metadata=metadata or {},
+                is_leaf=True,
+                created_at=now,
+                updated_at=now,
+            )
+            for child_id, description, metadata in children
+        ]
+
+        for node in nodes:
+            self._nodes[node.id] = node
+            self._children[node.id] = []
+            self._append_child(parent_id, node.id)
+
+        parent = self._nodes[parent_id]
+        self._nodes[parent_id] = parent.model_copy(update={"is_leaf": False, "updated_at": now})
+
+        self._version += 1
+        return nodes
+
     def get_node(self, node_id: NodeId) -> Node:
         """Get a node by ID."""
-        if node_id not in self._nodes:
+        node = self._nodes.get(node_id)
+        if node is None:
             raise TreeNotFoundError(f"Node {node_id} not found")
-        return self._nodes[node_id]
+        return node
 
     def update_node(
         self,
@@ -99,6 +172,7 @@ class TreeService:
 
         updated_node = node.model_copy(update=updates)
         self._nodes[node_id] = updated_node
+        self._version += 1
         return updated_node
 
     def delete_node(self, node_id: NodeId) -> None:
@@ -108,14 +182,10 @@ class TreeService:
         if node_id == self._root_id:
             raise InvalidOperationError("Cannot delete root node")
 
-        # Delete all descendants first
-        for child_id in list(self._children.get(node_id, [])):
-            self.delete_node(child_id)
-
         # Remove from parent's children list
         if node.parent_id:
             parent_children = self._children[node.parent_id]
-            parent_children.remove(node_id)
+            self._remove_child(node.parent_id, node_id)
 
             # Update parent's is_leaf status
             if len(parent_children) == 0:
@@ -124,15 +194,67 @@ class TreeService:
                     update={"is_leaf": True, "updated_at": datetime.now()}
                 )
 
-        # Delete the node
-        del self._nodes[node_id]
-        del self._children[node_id]
+        self._discard_subtrees([node_id])
+        self._version += 1
+
+    def delete_descendants(self, node_id: NodeId) -> Node:
+        """Delete every descendant of a node in one pass, leaving it a leaf.
+
+        Args:
+            node_id: ID of the node whose descendants to delete
+
+        Returns:
+            The node after the deletion (a leaf)
+
+        Raises:
+            TreeNotFoundError: If the node does not exist
+        """
+        node = self.get_node(node_id)
+        child_ids = self._children[node_id]
+        if not child_ids:
+            return node
+
+        # The children go as a group, so no remaining positions need renumbering
+        self._children[node_id] = []
+        self._discard_subtrees(child_ids)
+
+        updated_node = node.model_copy(update={"is_leaf": True, "updated_at": datetime.now()})
+        self._nodes[node_id] = updated_node
+        self._version += 1
+        return updated_node
 
     def get_children(self, node_id: NodeId) -> list[Node]:
         """Get all children of a node."""
+        return [self._nodes[child_id] for child_id in self._child_ids(node_id)]
+
+    def get_children_with_counts(self, node_id: NodeId) -> list[tuple[Node, int]]:
+        """Get all children of a node, each paired with its own number of children.
+
+        Args:
+            node_id: ID of the parent node
+
+        Returns:
+            List of (child, child_count) tuples in child order
+
+        Raises:
+            TreeNotFoundError: If the node does not exist
+        """
+        nodes = self._nodes
+        children = self._children
+        return [(nodes[child_id], len(children[child_id])) for child_id in self._child_ids(node_id)]
+
+    def get_child_ids(self, node_id: NodeId) -> list[NodeId]:
+        """Get the IDs of a node's children without materializing the nodes."""
+        return list(self._child_ids(node_id))
+
+    def get_child_count(self, node_id: NodeId) -> int:
+        """Get the number of children of a node."""
+        return len(self._child_ids(node_id))
+
+    def get_sibling_index(self, node_id: NodeId) -> int:
+        """Get a node's position among its siblings (0 for the root)."""
         self.get_node(node_id)  # Verify node exists
-        child_ids = self._children.get(node_id, [])
-        return [self._nodes[child_id] for child_id in child_ids]
+        return self._child_index.get(node_id, 0)
 
     def get_siblings(self, node_id: NodeId) -> list[Node]:
         """Get all siblings of a node (including itself)."""
@@ -145,6 +267,19 @@ class TreeService:
         # Get parent's children (which includes this node)
         return self.get_children(node.parent_id)
 
+    def get_first_child(self, node_id: NodeId) -> Node | None:
+        """Get the first child of a node."""
+        child_ids = self._child_ids(node_id)
+        return self._nodes[child_ids[0]] if child_ids else None
+
+    def get_prev_sibling(self, node_id: NodeId) -> Node | None:
+        """Get the sibling immediately before a node."""
+        return self._sibling_at(node_id, -1)
+
+    def get_next_sibling(self, node_id: NodeId) -> Node | None:
+        """Get the sibling immediately after a node."""
+        return self._sibling_at(node_id, 1)
+
     def get_parent(self, node_id: NodeId) -> Node | None:
         """Get the parent of a node."""
         node = self.get_node(node_id)
@@ -174,7 +309,7 @@ class TreeService:
         # Remove from old parent
         if old_parent_id:
             old_parent_children = self._children[old_parent_id]
-            old_parent_children.remove(node_id)
+            self._remove_child(old_parent_id, node_id)
 
             # Update old parent's is_leaf status
             if len(old_parent_children) == 0:
@@ -184,7 +319,7 @@ class TreeService:
                 )
 
         # Add to new parent
-        self._children[new_parent_id].append(node_id)
+        self._append_child(new_parent_id, node_id)
 
         # Update new parent's is_leaf status
         new_parent = self._nodes[new_parent_id]
@@ -195,9 +330,60 @@ class TreeService:
         # Update node's parent_id
         updated_node = node.model_copy(update={"parent_id": new_parent_id, "updated_at": now})
         self._nodes[node_id] = updated_node
+        self._version += 1
 
         return updated_node
 
+    def _child_ids(self, node_id: NodeId) -> list[NodeId]:
+        """Get the internal child list of a node, which also proves the node exists."""
+        child_ids = self._children.get(node_id)
+        if child_ids is None:
+            raise TreeNotFoundError(f"Node {node_id} not found")
+        return child_ids
+
+    def _sibling_at(self, node_id: NodeId, offset: int) -> Node | None:
+        """Get the sibling `offset` places from a node, or None past either end."""
+        node = self.get_node(node_id)
+        if node.parent_id is None:
+            return None
+        siblings = self._children[node.parent_id]
+        index = self._child_index[node_id] + offset
+        if 0 <= index < len(siblings):
+            return self._nodes[siblings[index]]
+        return None
+
+    def _append_child(self, parent_id: NodeId, node_id: NodeId) -> None:
+        """Append node_id as the last child of parent_id, recording its position."""
+        siblings = self._children[parent_id]
+        self._child_index[node_id] = len(siblings)
+        siblings.append(node_id)
+
+    def _remove_child(self, parent_id: NodeId, node_id: NodeId) -> None:
+        """Remove node_id from parent_id's children, keeping the other positions current."""
+        siblings = self._children[parent_id]
+        index = self._child_index.pop(node_id)
+        del siblings[index]
+        # Everything after the removed child moves up one place
+        for position in range(index, len(siblings)):
+            self._child_index[siblings[position]] = position
+
+    def _discard_subtrees(self, top_ids: list[NodeId]) -> None:
+        """Drop the given nodes and all their descendants from storage.
+
+        Callers detach top_ids from their parent first; the positions recorded inside
+        the discarded subtrees go with them.
+        """
+        # Collect breadth-first; a worklist rather than recursion keeps deep chains from
+        # hitting the interpreter's recursion limit
+        subtree = list(top_ids)
+        for current_id in subtree:
+            subtree.extend(self._children[current_id])
+
+        for current_id in subtree:
+            del self._nodes[current_id]
+            del self._children[current_id]
+            self._child_index.pop(current_id, None)
+
     def _would_create_cycle(self, node_id: NodeId, new_parent_id: NodeId) -> bool:
         """Check if moving node_id under new_parent_id would create a cycle."""
         # Walk up from new_parent_id to see if we reach node_id
@@ -3,7 +3,7 @@
 from typing import Any
 
 from tree.models import Node
-from tree.services.tree import TreeService
+from tree.services.tree import InvalidOperationError, TreeService
 from tree.types import NodeId
 
 
@@ -20,48 +20,15 @@ class ZipperService:
 
     def down(self, node_id: NodeId) -> Node | None:
         """Navigate down to first child node."""
-        children = self.tree.get_children(node_id)
-        if not children:
-            return None
-        return children[0]
+        return self.tree.get_first_child(node_id)
 
     def left(self, node_id: NodeId) -> Node | None:
         """Navigate left to previous sibling."""
-        node = self.tree.get_node(node_id)
-        if node.parent_id is None:
-            # Root has no siblings
-            return None
-
-        siblings = self.tree.get_siblings(node_id)
-        try:
-            current_index = next(i for i, s in enumerate(siblings) if s.id == node_id)
-        except StopIteration:
-            return None
-
-        if current_index == 0:
-            # Already at first sibling
-            return None
-
-        return siblings[current_index - 1]
+        return self.tree.get_prev_sibling(node_id)
 
     def right(self, node_id: NodeId) -> Node | None:
         """Navigate right to next sibling."""
-        node = self.tree.get_node(node_id)
-        if node.parent_id is None:
-            # Root has no siblings
-            return None
-
-        siblings = self.tree.get_siblings(node_id)
-        try:
-            current_index = next(i for i, s in enumerate(siblings) if s.id == node_id)
-        except StopIteration:
-            return None
-
-        if current_index == len(siblings) - 1:
-            # Already at last sibling
-            return None
-
-        return siblings[current_index + 1]
+        return self.tree.get_next_sibling(node_id)
 
     def root(self) -> Node | None:
         """Get the root node."""
@@ -84,20 +51,12 @@ class ZipperService:
         Raises:
             InvalidOperationError: If node is not a leaf
         """
-        from tree.services.tree import InvalidOperationError
-
         node = self.tree.get_node(node_id)
         if not node.is_leaf:
             raise InvalidOperationError(f"Node {node_id} is not a leaf, cannot expand")
 
-        # Create all children
-        for child_id, description, metadata in children_data:
-            self.tree.create_node(
-                node_id=child_id,
-                description=description,
-                parent_id=node_id,
-                metadata=metadata,
-            )
+        # Create all children in one batch; a clashing ID leaves the node untouched
+        self.tree.bulk_create(node_id, children_data)
 
         # Return updated node (will now be a branch)
         return self.tree.get_node(node_id)
@@ -115,20 +74,15 @@ class ZipperService:
         Raises:
             InvalidOperationError: If node is already a leaf
         """
-        from tree.services.tree import InvalidOperationError
-
         node = self.tree.get_node(node_id)
         if node.is_leaf:
             raise InvalidOperationError(f"Node {node_id} is already a leaf, cannot collapse")
 
-        # Delete all children (recursively)
-        children = self.tree.get_children(node_id)
-        for child in children:
-            self.tree.delete_node(child.id)
+        # Delete all descendants in a single pass
+        node = self.tree.delete_descendants(node_id)
 
         # Update description if summary provided
         if summary is not None:
             return self.tree.update_node(node_id, description=summary)
 
-        # Return updated node (will now be a leaf)
-        return self.tree.get_node(node_id)
+        return node
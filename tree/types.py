@@ -4,7 +4,7 @@ from typing import Annotated
 
 from pydantic import Field
 
-# NodeId represents both node identifiers and link hrefs
+# NodeId represents node identifiers (link hrefs are plain strings, see Link)
 # This allows us to easily change the implementation later
 # (e.g., switch from strings to UUIDs, or use path-based IDs)
 NodeId = Annotated[str, Field(min_length=1, max_length=255)]
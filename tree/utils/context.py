@@ -11,6 +11,13 @@ class ContextBuilder:
     def __init__(self, tree: TreeService) -> None:
         """Initialize context builder with tree service."""
         self.tree = tree
+        # Breadcrumb trail from the root to (and including) the parent of each node whose
+        # breadcrumbs were computed, valid for the current tree version; siblings then
+        # share one parent walk
+        self._trails: dict[NodeId, tuple[Breadcrumb, ...]] = {}
+        # Contexts already built for the current tree version, handed out again as-is
+        self._contexts: dict[NodeId, Context] = {}
+        self._version = tree.version
 
     def build_context(self, node_id: NodeId) -> Context:
         """Build zipper-style context with breadcrumbs for a node.
@@ -21,44 +28,121 @@ class ContextBuilder:
         Returns:
             Context with depth, sibling position, and breadcrumbs
         """
+        version = self._sync_version()
+        cached = self._contexts.get(node_id)
+        if cached is not None:
+            return cached
+
         node = self.tree.get_node(node_id)
         breadcrumbs = self._compute_breadcrumbs(node)
-        siblings = self.tree.get_siblings(node_id)
-        children = self.tree.get_children(node_id)
-
-        # Find position of current node in siblings list
-        sibling_position = next(i for i, s in enumerate(siblings) if s.id == node_id)
+        total_siblings = (
+            self.tree.get_child_count(node.parent_id) if node.parent_id is not None else 1
+        )
 
-        return Context(
+        context = Context(
             depth=len(breadcrumbs),
-            sibling_position=sibling_position,
-            total_siblings=len(siblings),
+            sibling_position=self.tree.get_sibling_index(node_id),
+            total_siblings=total_siblings,
             has_children=not node.is_leaf,
-            children_count=len(children),
+            children_count=self.tree.get_child_count(node_id),
             breadcrumbs=breadcrumbs,
         )
+        # Cache only if no write landed while building, or a stale context would be
+        # filed under the new version
+        if self.tree.version == version:
+            self._contexts[node_id] = context
+        return context
 
-    def _compute_breadcrumbs(self, node: Node) -> list[Breadcrumb]:
-        """Walk up to root building breadcrumb trail.
+    def build_child_contexts(self, parent_id: NodeId) -> list[tuple[Node, Context]]:
+        """Build contexts for every child of a node, sharing the walk up to the root.
+
+        Siblings have the same depth and breadcrumb trail, so the parent chain is
+        walked once rather than once per child. The children are read from the tree in
+        one go and returned alongside their contexts, so callers never have to fetch
+        them separately and risk a list that no longer lines up.
 
         Args:
-            node: Node to start from
+            parent_id: ID of the node whose children to build contexts for
 
         Returns:
-            List of breadcrumbs from root to parent (not including current node)
+            (child, context) pairs in child order, each context equal to build_context
+            for that child
         """
-        breadcrumbs: list[Breadcrumb] = []
-        current_id = node.parent_id
-
-        while current_id is not None:
-            parent = self.tree.get_node(current_id)
-            breadcrumbs.insert(
-                0,
-                Breadcrumb(
-                    id=parent.id,
-                    description=parent.description,
+        version = self._sync_version()
+        parent = self.tree.get_node(parent_id)
+        breadcrumbs = self._compute_breadcrumbs(parent) + (
+            Breadcrumb.intern(id=parent.id, description=parent.description),
+        )
+        children = self.tree.get_children_with_counts(parent_id)
+
+        pairs = [
+            (
+                child,
+                Context(
+                    depth=len(breadcrumbs),
+                    sibling_position=position,
+                    total_siblings=len(children),
+                    has_children=not child.is_leaf,
+                    children_count=children_count,
+                    breadcrumbs=breadcrumbs,
                 ),
             )
-            current_id = parent.parent_id
+            for position, (child, children_count) in enumerate(children)
+        ]
+        if self.tree.version == version:
+            self._contexts.update((child.id, context) for child, context in pairs)
+        return pairs
+
+    def _sync_version(self) -> int:
+        """Drop cached trails and contexts if the tree has changed since they were built.
+
+        Returns:
+            The tree version the caches now belong to, read before anything else
+        """
+        version = self.tree.version
+        if self._version != version:
+            self._trails.clear()
+            self._contexts.clear()
+            self._version = version
+        return version
+
+    def _compute_breadcrumbs(self, node: Node) -> tuple[Breadcrumb, ...]:
+        """Walk up to root building breadcrumb trail.
+
+        Trails built earlier for the same tree version are reused, so the walk stops
+        at the nearest ancestor that already has one.
+
+        Args:
+            node: Node to start from
+
+        Returns:
+            Tuple of breadcrumbs from root to parent (not including current node)
+        """
+        if node.parent_id is None:
+            return ()
+
+        version = self._sync_version()
+        trail = self._trails.get(node.parent_id)
+        if trail is None:
+            # Walk up only as far as the nearest ancestor with a known trail
+            breadcrumbs: list[Breadcrumb] = []
+            current_id: NodeId | None = node.parent_id
+            prefix: tuple[Breadcrumb, ...] = ()
+
+            while current_id is not None:
+                cached = self._trails.get(current_id)
+                if cached is not None:
+                    prefix = cached
+                    break
+                parent = self.tree.get_node(current_id)
+                breadcrumbs.append(Breadcrumb.intern(id=parent.id, description=parent.description))
+                current_id = parent.parent_id
+
+            # Collected nearest-first; reverse once rather than inserting at the front
+            breadcrumbs.reverse()
+            trail = prefix + tuple(breadcrumbs)
+            # A rename or move during the walk must not leave this trail under the new version
+            if self.tree.version == version:
+                self._trails[node.parent_id] = trail
 
-        return breadcrumbs
+        return trail
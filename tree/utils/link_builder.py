@@ -1,12 +1,64 @@
 """Link builder for computing HATEOAS navigation links."""
 
-from tree.models import Link
+from collections.abc import Callable, Collection, Iterable, Iterator, Mapping
+
+from tree.models import Link, Node
 from tree.services.traversal import TraversalService
 from tree.services.tree import TreeService
 from tree.services.zipper import ZipperService
 from tree.types import NodeId
 
 
+class LazyLinks(Mapping[str, Link]):
+    """Read-only mapping of link relations that builds each Link on first access.
+
+    Entries are resolved against the live tree when first read, not when the view is
+    built. Use a view straight away (e.g. copy it with dict()) rather than holding on
+    to it: read after a mutation it mixes old and new state, and once its node has
+    been deleted, reading an unresolved entry raises TreeNotFoundError.
+    """
+
+    # One view is cached per node, so keep instances free of a per-object __dict__
+    __slots__ = ("_node_id", "_factories", "_resolved")
+
+    def __init__(
+        self,
+        node_id: NodeId,
+        factories: Mapping[str, Callable[[NodeId], Link | None]],
+        resolved: dict[str, Link | None] | None = None,
+    ) -> None:
+        """Initialize a view of a node's links, optionally with some already resolved."""
+        self._node_id = node_id
+        self._factories = factories
+        self._resolved: dict[str, Link | None] = resolved if resolved is not None else {}
+
+    def _resolve(self, rel: str) -> Link | None:
+        """Build (once) and return the link for a relation, or None if it does not apply."""
+        if rel in self._resolved:
+            return self._resolved[rel]
+        factory = self._factories.get(rel)
+        if factory is None:
+            # Unknown relations are not cached, so arbitrary lookups cannot grow the view
+            return None
+        link = self._resolved[rel] = factory(self._node_id)
+        return link
+
+    def __getitem__(self, rel: str) -> Link:
+        link = self._resolve(rel)
+        if link is None:
+            raise KeyError(rel)
+        return link
+
+    def __iter__(self) -> Iterator[str]:
+        return (rel for rel in self._factories if self._resolve(rel) is not None)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self)!r})"
+
+
 class LinkBuilder:
     """Builds HATEOAS navigation links for nodes."""
 
@@ -20,67 +72,150 @@ class LinkBuilder:
         self.tree = tree
         self.zipper = zipper
         self.traversal = traversal
-
-    def build_links(self, node_id: NodeId) -> dict[str, Link]:
+        # One factory per relation, in the order links are listed in responses
+        self._factories: dict[str, Callable[[NodeId], Link | None]] = {
+            "self": self._build_self,
+            "root": self._build_root,
+            "up": self._build_up,
+            "down": self._build_down,
+            "left": self._build_left,
+            "right": self._build_right,
+            "next-dfs": self._build_next_dfs,
+            "prev-dfs": self._build_prev_dfs,
+            "next-bfs": self._build_next_bfs,
+            "children": self._build_children,
+        }
+        # Link views handed out for the current tree version; dropped wholesale on any mutation
+        self._cache: dict[NodeId, LazyLinks] = {}
+        self._cache_version = tree.version
+        # Every node links to the same root, so its link is built once per tree version
+        self._root_link: Link | None = None
+        self._root_link_version = -1
+
+    def build_links(self, node_id: NodeId) -> Mapping[str, Link]:
         """Compute all valid navigation links from a node.
 
+        Links are built lazily, so callers that read one relation only pay for that one.
+        Read the mapping before the tree changes again (see LazyLinks).
+
         Args:
             node_id: ID of the node to build links for
 
         Returns:
-            Dictionary of link relation names to Link objects
-        """
-        node = self.tree.get_node(node_id)
-        links: dict[str, Link] = {}
-
-        # Self link (always present)
-        links["self"] = Link(href=node_id, title=node.description)
-
-        # Root link (always present)
-        root = self.tree.get_root()
-        if root is not None:
-            links["root"] = Link(href=root.id, title=root.description)
-
-        # Parent link (up)
-        parent = self.zipper.up(node_id)
-        if parent is not None:
-            links["up"] = Link(href=parent.id, title=parent.description)
-
-        # First child link (down)
-        child = self.zipper.down(node_id)
-        if child is not None:
-            links["down"] = Link(href=child.id, title=child.description)
-
-        # Previous sibling link (left)
-        left_sibling = self.zipper.left(node_id)
-        if left_sibling is not None:
-            links["left"] = Link(href=left_sibling.id, title=left_sibling.description)
-
-        # Next sibling link (right)
-        right_sibling = self.zipper.right(node_id)
-        if right_sibling is not None:
-            links["right"] = Link(href=right_sibling.id, title=right_sibling.description)
-
-        # Next DFS link
-        next_dfs = self.traversal.compute_next_dfs(node_id)
-        if next_dfs is not None:
-            links["next-dfs"] = Link(href=next_dfs.id, title=next_dfs.description)
-
-        # Previous DFS link
-        prev_dfs = self.traversal.compute_prev_dfs(node_id)
-        if prev_dfs is not None:
-            links["prev-dfs"] = Link(href=prev_dfs.id, title=prev_dfs.description)
-
-        # Next BFS link
-        next_bfs = self.traversal.compute_next_bfs(node_id)
-        if next_bfs is not None:
-            links["next-bfs"] = Link(href=next_bfs.id, title=next_bfs.description)
-
-        # Children collection link (if node has children)
-        if not node.is_leaf:
-            links["children"] = Link(
-                href=f"{node_id}/children",
-                title=f"Children of {node.description}",
-            )
+            Read-only mapping of link relation names to Link objects
 
+        Raises:
+            TreeNotFoundError: If the node does not exist
+        """
+        # Read the version before the node, so a write landing mid-build is never
+        # filed under the new version
+        version = self.tree.version
+        if self._cache_version != version:
+            self._cache.clear()
+            self._cache_version = version
+
+        links = self._cache.get(node_id)
+        if links is None:
+            node = self.tree.get_node(node_id)
+            links = LazyLinks(node_id, self._factories, self._known_links(node))
+            if self.tree.version == version:
+                self._cache[node_id] = links
         return links
+
+    def _known_links(self, node: Node) -> dict[str, Link | None]:
+        """Resolve the relations that follow from the node's shape alone."""
+        resolved: dict[str, Link | None] = {}
+        if node.parent_id is None:
+            # The root is its own root and has no parent or siblings
+            self_link = Link.intern(href=node.id, title=node.description)
+            if node.is_leaf:
+                # A lone root links only to itself, so no other factory needs to run
+                resolved = dict.fromkeys(self._factories)
+            resolved.update({"up": None, "left": None, "right": None})
+            resolved["self"] = resolved["root"] = self_link
+        if node.is_leaf:
+            resolved["down"] = resolved["children"] = None
+        return resolved
+
+    def build_links_batch(
+        self,
+        node_ids: Iterable[NodeId],
+        rels: Collection[str] | None = None,
+    ) -> dict[NodeId, dict[str, Link]]:
+        """Compute links for several nodes at once.
+
+        Traversal indices are shared across the batch, and restricting ``rels``
+        skips building the other links entirely.
+
+        Args:
+            node_ids: IDs of the nodes to build links for
+            rels: Link relations to include (default: all that apply)
+
+        Returns:
+            Dictionary of node IDs to their link dictionaries, in the order given
+
+        Raises:
+            TreeNotFoundError: If any node does not exist
+        """
+        views = {node_id: self.build_links(node_id) for node_id in node_ids}
+        if rels is None:
+            return {node_id: dict(links) for node_id, links in views.items()}
+        return {
+            node_id: {rel: links[rel] for rel in self._factories if rel in rels and rel in links}
+            for node_id, links in views.items()
+        }
+
+    @staticmethod
+    def _link_to(node: Node | None) -> Link | None:
+        """Link to a node, titled with its description."""
+        if node is None:
+            return None
+        return Link.intern(href=node.id, title=node.description)
+
+    def _build_self(self, node_id: NodeId) -> Link | None:
+        """Self link (always present)."""
+        return self._link_to(self.tree.get_node(node_id))
+
+    def _build_root(self, node_id: NodeId) -> Link | None:
+        """Root link (always present)."""
+        # Read the version first, so a write landing mid-build leaves the link marked stale
+        version = self.tree.version
+        if self._root_link_version != version:
+            self._root_link = self._link_to(self.tree.get_root())
+            self._root_link_version = version
+        return self._root_link
+
+    def _build_up(self, node_id: NodeId) -> Link | None:
+        """Parent link."""
+        return self._link_to(self.zipper.up(node_id))
+
+    def _build_down(self, node_id: NodeId) -> Link | None:
+        """First child link."""
+        return self._link_to(self.zipper.down(node_id))
+
+    def _build_left(self, node_id: NodeId) -> Link | None:
+        """Previous sibling link."""
+        return self._link_to(self.zipper.left(node_id))
+
+    def _build_right(self, node_id: NodeId) -> Link | None:
+        """Next sibling link."""
+        return self._link_to(self.zipper.right(node_id))
+
+    def _build_next_dfs(self, node_id: NodeId) -> Link | None:
+        """Next DFS link."""
+        return self._link_to(self.traversal.compute_next_dfs(node_id))
+
+    def _build_prev_dfs(self, node_id: NodeId) -> Link | None:
+        """Previous DFS link."""
+        return self._link_to(self.traversal.compute_prev_dfs(node_id))
+
+    def _build_next_bfs(self, node_id: NodeId) -> Link | None:
+        """Next BFS link."""
+        return self._link_to(self.traversal.compute_next_bfs(node_id))
+
+    def _build_children(self, node_id: NodeId) -> Link | None:
+        """Children collection link (if node has children)."""
+        node = self.tree.get_node(node_id)
+        if node.is_leaf:
+            return None
+        return Link.intern(href=f"{node_id}/children", title=f"Children of {node.description}")